@@ -5,13 +5,47 @@ Streamlit UI for notes, meetings, people, reminders, and AI-powered insights
 
 import streamlit as st
 import requests
+import atexit
+import threading
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 import json
-from typing import Dict, Any, Optional
+import pandas as pd
+from io import BytesIO
+from PIL import Image
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
+from typing import Dict, Any, List, Optional, Tuple
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # API Configuration
 API_BASE_URL = "http://localhost:8000/api"
+API_TIMEOUT = (3, 60)  # (connect, read) - read is generous for LLM-backed endpoints
+
+# Pooled HTTP session shared by every api_request call (keep-alive to the backend)
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(
+    pool_connections=50,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+))
+atexit.register(_SESSION.close)
+
+# Long-lived fan-out pool for page loads - threads are reused instead of spawned per rerun
+_FETCH_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="rumee-fetch")
+atexit.register(_FETCH_POOL.shutdown, wait=False)
+
+# Last ETag and body per (url, params, auth) for conditional GETs of large graph payloads
+ETAG_CACHE_SIZE = 256
+_ETAG_CACHE: Dict[Tuple, Tuple[str, Any]] = {}
+
+# Display constants
+PRIORITY_EMOJI = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+WEEKS_LABELS = ('This week', 'Last week', '2 weeks ago', '3 weeks ago')
 
 # Session state initialization
 if "token" not in st.session_state:
@@ -19,28 +53,53 @@ if "token" not in st.session_state:
 if "user" not in st.session_state:
     st.session_state.user = None
 
+# Tier-0 memo for GETs - the script top runs once per full rerun, so this resets every rerun
+st.session_state._rerun_memo = {}
+
 
 # API Client Functions
-def api_request(method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict[str, Any]:
-    """Make API request with authentication"""
-    headers = {}
-    if st.session_state.token:
-        headers["Authorization"] = f"Bearer {st.session_state.token}"
+def api_request(method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None,
+                read_only: bool = False) -> Dict[str, Any]:
+    """Make API request with authentication (read_only marks a POST that only reads)"""
+    # Built once at login; never mutated here
+    headers = st.session_state.get("auth_headers") or {}
     
     url = f"{API_BASE_URL}{endpoint}"
     
+    etag_key = None
+    if method == "GET":
+        etag_key = (url, repr(sorted(params.items())) if params else "", headers.get("Authorization"))
+        if etag_key in _ETAG_CACHE:
+            headers = {**headers, "If-None-Match": _ETAG_CACHE[etag_key][0]}
+    
     try:
-        if method == "GET":
-            response = requests.get(url, headers=headers, params=params)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=data)
-        elif method == "PUT":
-            response = requests.put(url, headers=headers, json=data)
-        elif method == "DELETE":
-            response = requests.delete(url, headers=headers)
+        response = _SESSION.request(
+            method, url, headers=headers, json=data, params=params, timeout=API_TIMEOUT
+        )
+        
+        if response.status_code == 304 and etag_key in _ETAG_CACHE:
+            # Unchanged since our last copy - the backend skipped sending the body
+            return _ETAG_CACHE[etag_key][1]
         
         if response.status_code in [200, 201]:
-            return response.json()
+            if method != "GET" and not read_only:
+                # Any successful write may change what the cached reads return
+                st.session_state._rerun_memo = {}
+                _cached_get.clear()
+                _cached_get_15s.clear()
+                _cached_connections.clear()
+                if method == "POST" and endpoint == "/notes":
+                    # Only a new note feeds the AI brain - its slower caches survive other writes
+                    _cached_get_60s.clear()
+                    _cached_get_120s.clear()
+                    _cached_get_300s.clear()
+            body = response.json()
+            etag = response.headers.get("ETag")
+            if etag_key and etag:
+                if len(_ETAG_CACHE) >= ETAG_CACHE_SIZE:
+                    _ETAG_CACHE.clear()
+                _ETAG_CACHE[etag_key] = (etag, body)
+            return body
         else:
             st.error(f"API Error: {response.status_code} - {response.text}")
             return {}
@@ -49,12 +108,145 @@ def api_request(method: str, endpoint: str, data: Optional[Dict] = None, params:
         return {}
 
 
+def _params_key(params: Optional[Dict]) -> Tuple:
+    """Hashable form of GET params - list values become tuples"""
+    if not params:
+        return ()
+    return tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in params.items()))
+
+
+def _params_from_key(params_key: Tuple) -> Optional[Dict]:
+    """GET params back from _params_key, with tuple values restored to lists"""
+    return {k: list(v) if isinstance(v, tuple) else v for k, v in params_key} or None
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_get(endpoint: str, params_key: Tuple = (), token: Optional[str] = None) -> Any:
+    """Cached GET - token is part of the cache key so users never share entries"""
+    return api_request("GET", endpoint, params=_params_from_key(params_key))
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _cached_get_15s(endpoint: str, params_key: Tuple = (), token: Optional[str] = None) -> Any:
+    """Cached GET for fast-changing data"""
+    return api_request("GET", endpoint, params=_params_from_key(params_key))
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_get_60s(endpoint: str, params_key: Tuple = (), token: Optional[str] = None) -> Any:
+    """Cached GET for AI insights"""
+    return api_request("GET", endpoint, params=_params_from_key(params_key))
+
+
+@st.cache_data(ttl=120, show_spinner=False)
+def _cached_get_120s(endpoint: str, params_key: Tuple = (), token: Optional[str] = None) -> Any:
+    """Cached GET for AI brain status"""
+    return api_request("GET", endpoint, params=_params_from_key(params_key))
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_get_300s(endpoint: str, params_key: Tuple = (), token: Optional[str] = None) -> Any:
+    """Cached GET for slow-moving AI patterns"""
+    return api_request("GET", endpoint, params=_params_from_key(params_key))
+
+
+# Endpoints whose volatility differs from the 30s default
+CACHED_GET_BY_ENDPOINT = {
+    "/reminders": _cached_get_15s,
+    "/ai/insights": _cached_get_60s,
+    "/ai/brain-status": _cached_get_120s,
+    "/ai/patterns": _cached_get_300s,
+}
+
+
+def api_get(endpoint: str, params: Optional[Dict] = None) -> Any:
+    """Read-only GET served from a short-lived cache across reruns"""
+    params_key = _params_key(params)
+    memo = st.session_state.get("_rerun_memo")
+    if memo is not None and (endpoint, params_key) in memo:
+        return memo[(endpoint, params_key)]
+    cached_get = CACHED_GET_BY_ENDPOINT.get(endpoint, _cached_get)
+    result = cached_get(endpoint, params_key, st.session_state.token)
+    if memo is not None:
+        memo[(endpoint, params_key)] = result
+    return result
+
+
+def _api_get_in_context(ctx, endpoint: str, params: Optional[Dict]) -> Any:
+    """Run api_get on a pool thread under the caller's script context"""
+    # Pool threads are reused across sessions, so attach the context per task
+    add_script_run_ctx(threading.current_thread(), ctx)
+    return api_get(endpoint, params)
+
+
+def api_get_many(requests_by_name: Dict[str, Tuple[str, Optional[Dict]]]) -> Dict[str, Any]:
+    """Issue independent GET requests concurrently, keyed by name"""
+    # Worker threads need the script context to read session state and report errors
+    ctx = get_script_run_ctx()
+    futures = {
+        name: _FETCH_POOL.submit(_api_get_in_context, ctx, endpoint, params)
+        for name, (endpoint, params) in requests_by_name.items()
+    }
+    return {name: future.result() for name, future in futures.items()}
+
+
+def split_reminders(reminders: Optional[List[Dict]]) -> Tuple[List[Dict], List[Dict]]:
+    """Split a single /reminders response into (pending, completed)"""
+    pending, completed = [], []
+    for reminder in reminders or []:
+        status = reminder.get('status')
+        if status == 'pending':
+            pending.append(reminder)
+        elif status == 'completed':
+            completed.append(reminder)
+    return pending, completed
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_connections(note_ids: Tuple[str, ...], token: Optional[str] = None) -> Any:
+    """Cached batch connections lookup - the ids go in a POST body so the URL stays short"""
+    return api_request("POST", "/ai/connections/batch", {"note_ids": list(note_ids)}, read_only=True)
+
+
+def batch_connections(note_ids: List[str]) -> Dict[str, List[Dict]]:
+    """AI-discovered connections for many notes in a single request"""
+    if not note_ids:
+        return {}
+    response = _cached_connections(tuple(note_ids), st.session_state.token)
+    return response.get("connections", {}) if response else {}
+
+
+@lru_cache(maxsize=4096)
+def format_timestamp(value: Optional[str]) -> str:
+    """Render an API ISO timestamp as 'YYYY-MM-DD HH:MM' (memoized across rows and reruns)"""
+    if not value:
+        return "N/A"
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M')
+
+
+def set_session(auth_response: Dict[str, Any]):
+    """Store the logged-in user, token and its prebuilt auth header"""
+    token = auth_response["access_token"]
+    st.session_state.token = token
+    st.session_state.user = auth_response["user"]
+    st.session_state.auth_headers = {"Authorization": f"Bearer {token}"}
+
+
+@st.cache_data(show_spinner=False)
+def make_thumbnail(image_bytes: bytes, max_size: int = 512) -> bytes:
+    """Downscaled JPEG preview of an uploaded image"""
+    image = Image.open(BytesIO(image_bytes))
+    image.thumbnail((max_size, max_size))
+    buffer = BytesIO()
+    image.convert("RGB").save(buffer, format="JPEG", quality=80)
+    return buffer.getvalue()
+
+
 def login(email: str, password: str) -> bool:
     """Login user"""
     response = api_request("POST", "/auth/login", {"email": email, "password": password})
     if response and "access_token" in response:
-        st.session_state.token = response["access_token"]
-        st.session_state.user = response["user"]
+        set_session(response)
         return True
     return False
 
@@ -67,8 +259,7 @@ def register(email: str, password: str, name: str) -> bool:
         "name": name
     })
     if response and "access_token" in response:
-        st.session_state.token = response["access_token"]
-        st.session_state.user = response["user"]
+        set_session(response)
         return True
     return False
 
@@ -77,6 +268,7 @@ def logout():
     """Logout user"""
     st.session_state.token = None
     st.session_state.user = None
+    st.session_state.auth_headers = None
     st.rerun()
 
 
@@ -114,38 +306,54 @@ def auth_page():
                 st.error("Registration failed")
 
 
+# Dashboard fragments - rerun on their own when their buttons are clicked
+@st.fragment
+def urgent_panel():
+    """High-priority reminders with inline completion"""
+    st.subheader("🔴 Needs Immediate Attention")
+    reminders, _ = split_reminders(api_get("/reminders"))
+    high_priority = [r for r in reminders if r.get('priority') == 'high']
+    
+    for reminder in high_priority[:3]:
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            st.write(f"🔥 **{reminder['title']}**")
+            if reminder.get('due_date'):
+                st.caption(f"Due: {reminder['due_date'][:10]}")
+        with col2:
+            if st.button("✓ Done", key=f"urgent_{reminder['id']}"):
+                api_request("PUT", f"/reminders/{reminder['id']}", {"status": "completed"})
+                st.rerun(scope="fragment")
+    
+    if not high_priority:
+        st.success("✨ No urgent items! You're on top of things.")
+
+
 # Dashboard Page - ACT FOCUSED
 def dashboard_page():
     """ACT-focused dashboard - What needs your attention NOW"""
     st.title(f"🎯 Focus Mode")
     st.caption("What needs your attention right now")
     
-    # Get data
-    notes = api_request("GET", "/notes")
-    reminders = api_request("GET", "/reminders", params={"status": "pending"})
-    meetings = api_request("GET", "/meetings")
-    people = api_request("GET", "/people")
+    # Get data - all dashboard requests are independent, so fetch them concurrently
+    data = api_get_many({
+        "notes": ("/notes", None),
+        "reminders": ("/reminders", None),
+        "meetings": ("/meetings", None),
+        "people": ("/people", None),
+        "brain_status": ("/ai/brain-status", None),
+        "context": ("/ai/context", None),
+        "insights": ("/ai/insights", None),
+        "patterns": ("/ai/patterns", None),
+    })
+    notes = data["notes"]
+    # One reminders request serves both the pending list and the completed count
+    reminders, completed = split_reminders(data["reminders"])
+    meetings = data["meetings"]
+    people = data["people"]
     
     # SECTION 1: Immediate Actions (High Priority/Urgency)
-    st.subheader("🔴 Needs Immediate Attention")
-    urgent_items = []
-    
-    if reminders:
-        high_priority = [r for r in reminders if r.get('priority') == 'high']
-        if high_priority:
-            for reminder in high_priority[:3]:
-                col1, col2 = st.columns([4, 1])
-                with col1:
-                    st.write(f"🔥 **{reminder['title']}**")
-                    if reminder.get('due_date'):
-                        st.caption(f"Due: {reminder['due_date'][:10]}")
-                with col2:
-                    if st.button("✓ Done", key=f"urgent_{reminder['id']}"):
-                        api_request("PUT", f"/reminders/{reminder['id']}", {"status": "completed"})
-                        st.rerun()
-    
-    if not urgent_items:
-        st.success("✨ No urgent items! You're on top of things.")
+    urgent_panel()
     
     st.divider()
     
@@ -153,7 +361,7 @@ def dashboard_page():
     st.subheader("🧠 Your AI Brain is Working")
     
     # Get brain status
-    brain_status = api_request("GET", "/ai/brain-status")
+    brain_status = data["brain_status"]
     if brain_status and brain_status.get('status') == 'active':
         memory = brain_status.get('memory', {})
         
@@ -168,7 +376,7 @@ def dashboard_page():
             st.metric("🎯 Active Topics", memory.get('active_topics', 0))
     
     # Current Context
-    context_response = api_request("GET", "/ai/context")
+    context_response = data["context"]
     if context_response:
         context = context_response.get('context', {})
         if context.get('primary_focus'):
@@ -179,7 +387,7 @@ def dashboard_page():
     
     # Proactive Insights
     with st.expander("💡 Proactive Insights from AI Agents", expanded=True):
-        insights_response = api_request("GET", "/ai/insights")
+        insights_response = data["insights"]
         
         if insights_response:
             insights = insights_response.get('insights', [])
@@ -187,7 +395,7 @@ def dashboard_page():
             if insights:
                 for insight in insights[:5]:  # Show top 5
                     priority = insight.get('priority', 'low')
-                    emoji = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}.get(priority, '⚪')
+                    emoji = PRIORITY_EMOJI.get(priority, '⚪')
                     
                     with st.container():
                         st.write(f"{emoji} **{insight.get('title', 'Insight')}**")
@@ -199,7 +407,7 @@ def dashboard_page():
     
     # Detected Patterns
     with st.expander("📈 Detected Patterns & Trends"):
-        patterns_response = api_request("GET", "/ai/patterns")
+        patterns_response = data["patterns"]
         
         if patterns_response:
             patterns = patterns_response.get('patterns', {})
@@ -213,12 +421,11 @@ def dashboard_page():
             topic_evolution = patterns.get('topic_evolution', {})
             if topic_evolution:
                 st.write("\n**📊 Topic Evolution (last 4 weeks):**")
-                weeks_labels = ['This week', 'Last week', '2 weeks ago', '3 weeks ago']
                 for week_num, topics in sorted(topic_evolution.items()):
-                    if int(week_num) < 4:
-                        top_topics = sorted(topics.items(), key=lambda x: x[1], reverse=True)[:3]
+                    if int(week_num) < len(WEEKS_LABELS):
+                        top_topics = nlargest(3, topics.items(), key=itemgetter(1))
                         if top_topics:
-                            st.write(f"• **{weeks_labels[int(week_num)]}:** {', '.join([t[0] for t in top_topics])}")
+                            st.write(f"• **{WEEKS_LABELS[int(week_num)]}:** {', '.join([t[0] for t in top_topics])}")
             
             collab_patterns = patterns.get('collaboration_patterns', [])
             if collab_patterns:
@@ -231,15 +438,16 @@ def dashboard_page():
     # SECTION 3: Today's Context
     st.subheader("📅 Today's Context")
     col1, col2, col3 = st.columns(3)
+    today_prefix = datetime.now().strftime('%Y-%m-%d')
     
     with col1:
         st.metric("Active Tasks", len(reminders) if reminders else 0)
     with col2:
-        today_meetings = [m for m in meetings if m.get('scheduled_at', '').startswith(datetime.now().strftime('%Y-%m-%d'))] if meetings else []
-        st.metric("Today's Meetings", len(today_meetings))
+        today_meetings = sum(1 for m in meetings if (m.get('scheduled_at') or '')[:10] == today_prefix) if meetings else 0
+        st.metric("Today's Meetings", today_meetings)
     with col3:
-        recent_notes = [n for n in notes if n.get('created_at', '').startswith(datetime.now().strftime('%Y-%m-%d'))] if notes else []
-        st.metric("Notes Today", len(recent_notes))
+        notes_today = sum(1 for n in notes if (n.get('created_at') or '')[:10] == today_prefix) if notes else 0
+        st.metric("Notes Today", notes_today)
     
     # Quick stats
     with st.expander("📊 Overall Stats"):
@@ -251,8 +459,7 @@ def dashboard_page():
         with col3:
             st.metric("All Meetings", len(meetings) if meetings else 0)
         with col4:
-            completed = api_request("GET", "/reminders", params={"status": "completed"})
-            st.metric("Completed Tasks", len(completed) if completed else 0)
+            st.metric("Completed Tasks", len(completed))
 
 
 # Brain Dump Page - UNIFIED INBOX
@@ -325,7 +532,10 @@ def brain_dump_page():
         uploaded_file = st.file_uploader("Upload image", type=['png', 'jpg', 'jpeg'])
         
         if uploaded_file:
-            st.image(uploaded_file, caption="Uploaded Image", use_column_width=True)
+            # Keep the original for processing; only send a small preview to the browser
+            image_bytes = uploaded_file.getvalue()
+            st.session_state.pending_image = image_bytes
+            st.image(make_thumbnail(image_bytes), caption="Uploaded Image", use_container_width=True)
             st.info("📷 AI vision processing coming soon!")
             st.write("""
             Photo capture will:
@@ -342,19 +552,63 @@ def brain_dump_page():
     
     # Recent captures
     st.subheader("📥 Recent Captures")
-    notes = api_request("GET", "/notes")
+    notes = api_get("/notes", {"limit": 5})
     
     if notes:
-        # Sort by date, most recent first
-        sorted_notes = sorted(notes, key=lambda x: x.get('created_at', ''), reverse=True)
+        # Server returns the last 5, most recent first - render them as one table
+        df = pd.DataFrame([{
+            "Date": note['created_at'][:10],
+            "Title": note['title'],
+            "Preview": note['content'][:200] + "..." if len(note['content']) > 200 else note['content'],
+            "People": len((note.get('entities') or {}).get('people', [])),
+            "Topics": len((note.get('entities') or {}).get('topics', [])),
+        } for note in notes])
+        st.dataframe(df, hide_index=True, use_container_width=True)
+    else:
+        st.info("No captures yet. Start dumping your thoughts above!")
+
+
+@st.fragment
+def notes_list_panel():
+    """All notes with their AI connections - deleting reruns only this list"""
+    notes = api_get("/notes")
+    
+    if notes:
+        # One request for every note's connections instead of one per note
+        connections_by_note = batch_connections([note['id'] for note in notes])
         
-        for note in sorted_notes[:5]:  # Show last 5
-            with st.expander(f"📄 {note['title']} - {note['created_at'][:10]}"):
-                st.write(note['content'][:200] + "..." if len(note['content']) > 200 else note['content'])
+        for note in notes:
+            with st.expander(f"📄 {note['title']}"):
+                st.write(note['content'])
+                
+                if note.get('tags'):
+                    st.write("**Tags:**", ", ".join(note['tags']))
+                
                 if note.get('entities'):
-                    st.caption(f"🤖 AI found: {len(note['entities'].get('people', []))} people, {len(note['entities'].get('topics', []))} topics")
+                    st.write("**AI-Extracted Entities:**")
+                    entities = note['entities']
+                    if entities.get('people'):
+                        st.write(f"People: {', '.join(entities['people'])}")
+                    if entities.get('topics'):
+                        st.write(f"Topics: {', '.join(entities['topics'])}")
+                
+                # Show AI-discovered connections
+                connections = connections_by_note.get(note['id'])
+                if connections:
+                    st.write("\n**🔗 AI-Discovered Connections:**")
+                    for conn in connections[:3]:  # Show top 3
+                        strength_emoji = '🔴' if conn['strength'] > 0.8 else '🟡' if conn['strength'] > 0.6 else '🟢'
+                        st.write(f"{strength_emoji} **{conn['connection_type']}** → [{conn['target_title']}]")
+                        st.caption(f"_{conn['reason']}_")
+                
+                st.caption(f"Created: {note['created_at']}")
+                
+                if st.button(f"Delete", key=f"delete_note_{note['id']}"):
+                    api_request("DELETE", f"/notes/{note['id']}")
+                    st.success("Note deleted!")
+                    st.rerun(scope="fragment")
     else:
-        st.info("No captures yet. Start dumping your thoughts above!")
+        st.info("No notes yet. Create your first note above!")
 
 
 # Notes Page
@@ -381,8 +635,11 @@ def notes_page():
     
     # Search notes
     st.subheader("🔍 Search Notes")
-    search_query = st.text_input("Semantic search (AI-powered)")
-    if search_query and st.button("Search"):
+    # A form only reruns the script on submit, not every time the input loses focus
+    with st.form("note_search"):
+        search_query = st.text_input("Semantic search (AI-powered)")
+        search_submitted = st.form_submit_button("Search")
+    if search_submitted and search_query:
         results = api_request("POST", "/notes/search", params={"query": search_query})
         if results:
             for result in results:
@@ -392,43 +649,7 @@ def notes_page():
     
     # Display notes
     st.subheader("All Notes")
-    notes = api_request("GET", "/notes")
-    
-    if notes:
-        for note in notes:
-            with st.expander(f"📄 {note['title']}"):
-                st.write(note['content'])
-                
-                if note.get('tags'):
-                    st.write("**Tags:**", ", ".join(note['tags']))
-                
-                if note.get('entities'):
-                    st.write("**AI-Extracted Entities:**")
-                    entities = note['entities']
-                    if entities.get('people'):
-                        st.write(f"People: {', '.join(entities['people'])}")
-                    if entities.get('topics'):
-                        st.write(f"Topics: {', '.join(entities['topics'])}")
-                
-                # Show AI-discovered connections
-                connections_response = api_request("GET", f"/ai/connections/{note['id']}")
-                if connections_response and connections_response.get('connections'):
-                    connections = connections_response['connections']
-                    if connections:
-                        st.write("\n**🔗 AI-Discovered Connections:**")
-                        for conn in connections[:3]:  # Show top 3
-                            strength_emoji = '🔴' if conn['strength'] > 0.8 else '🟡' if conn['strength'] > 0.6 else '🟢'
-                            st.write(f"{strength_emoji} **{conn['connection_type']}** → [{conn['target_title']}]")
-                            st.caption(f"_{conn['reason']}_")
-                
-                st.caption(f"Created: {note['created_at']}")
-                
-                if st.button(f"Delete", key=f"delete_note_{note['id']}"):
-                    api_request("DELETE", f"/notes/{note['id']}")
-                    st.success("Note deleted!")
-                    st.rerun()
-    else:
-        st.info("No notes yet. Create your first note above!")
+    notes_list_panel()
 
 
 # People Page
@@ -462,7 +683,7 @@ def people_page():
                 st.rerun()
     
     # Display people
-    people = api_request("GET", "/people")
+    people = api_get("/people")
     
     if people:
         for person in people:
@@ -512,12 +733,11 @@ def meetings_page():
                 st.rerun()
     
     # Display meetings
-    meetings = api_request("GET", "/meetings")
+    meetings = api_get("/meetings")
     
     if meetings:
         for meeting in meetings:
-            scheduled = datetime.fromisoformat(meeting['scheduled_at'].replace('Z', '+00:00'))
-            with st.expander(f"📅 {meeting['title']} - {scheduled.strftime('%Y-%m-%d %H:%M')}"):
+            with st.expander(f"📅 {meeting['title']} - {format_timestamp(meeting['scheduled_at'])}"):
                 st.write(f"**Status:** {meeting['status']}")
                 if meeting.get('duration_minutes'):
                     st.write(f"**Duration:** {meeting['duration_minutes']} minutes")
@@ -532,6 +752,51 @@ def meetings_page():
         st.info("No meetings scheduled. Create your first meeting above!")
 
 
+@st.fragment
+def reminders_tabs():
+    """Pending/completed lists - completing a reminder reruns only the tabs"""
+    pending, completed = split_reminders(api_get("/reminders"))
+    tab1, tab2 = st.tabs(["Pending", "Completed"])
+    
+    with tab1:
+        if pending:
+            # One editable table instead of a columns/button pair per reminder
+            df = pd.DataFrame([{
+                "id": reminder['id'],
+                "Done": False,
+                "Priority": PRIORITY_EMOJI.get(reminder.get('priority'), '⚪'),
+                "Title": reminder['title'],
+                "Due": format_timestamp(reminder.get('due_date')),
+            } for reminder in pending])
+            edited = st.data_editor(
+                df,
+                column_config={
+                    "id": None,
+                    "Done": st.column_config.CheckboxColumn("Done", help="Mark as completed", width="small"),
+                },
+                disabled=["Priority", "Title", "Due"],
+                hide_index=True,
+                use_container_width=True,
+                # Keyed on the ids so stale row edits never carry over to a different list
+                key=f"pending_reminders_{hash(tuple(df['id']))}",
+            )
+            done_ids = edited.loc[edited["Done"], "id"].tolist()
+            if done_ids:
+                for reminder_id in done_ids:
+                    api_request("PUT", f"/reminders/{reminder_id}", {"status": "completed"})
+                st.rerun(scope="fragment")
+        else:
+            st.info("No pending reminders!")
+    
+    with tab2:
+        if completed:
+            for reminder in completed:
+                st.write(f"✅ {reminder['title']}")
+                st.caption(f"Completed: {reminder.get('completed_at', 'N/A')}")
+        else:
+            st.info("No completed reminders yet!")
+
+
 # Reminders Page
 def reminders_page():
     """Reminders/Tasks management"""
@@ -558,34 +823,7 @@ def reminders_page():
                 st.rerun()
     
     # Display reminders
-    tab1, tab2 = st.tabs(["Pending", "Completed"])
-    
-    with tab1:
-        reminders = api_request("GET", "/reminders", params={"status": "pending"})
-        if reminders:
-            for reminder in reminders:
-                due = datetime.fromisoformat(reminder['due_date'].replace('Z', '+00:00'))
-                priority_emoji = {"low": "🟢", "medium": "🟡", "high": "🔴"}
-                
-                col1, col2 = st.columns([4, 1])
-                with col1:
-                    st.write(f"{priority_emoji[reminder['priority']]} **{reminder['title']}**")
-                    st.caption(f"Due: {due.strftime('%Y-%m-%d %H:%M')}")
-                with col2:
-                    if st.button("✓", key=f"complete_{reminder['id']}"):
-                        api_request("PUT", f"/reminders/{reminder['id']}", {"status": "completed"})
-                        st.rerun()
-        else:
-            st.info("No pending reminders!")
-    
-    with tab2:
-        reminders = api_request("GET", "/reminders", params={"status": "completed"})
-        if reminders:
-            for reminder in reminders:
-                st.write(f"✅ {reminder['title']}")
-                st.caption(f"Completed: {reminder.get('completed_at', 'N/A')}")
-        else:
-            st.info("No completed reminders yet!")
+    reminders_tabs()
 
 
 # Knowledge Graph Page
@@ -595,7 +833,7 @@ def knowledge_graph_page():
     st.caption("Your entire world, connected")
     
     # Get graph stats
-    stats_response = api_request("GET", "/graph/stats")
+    stats_response = api_get("/graph/stats")
     
     if stats_response:
         stats = stats_response.get('stats', {})
@@ -620,13 +858,13 @@ def knowledge_graph_page():
                 col1, col2 = st.columns(2)
                 with col1:
                     st.write("**Nodes by Type:**")
-                    for node_type, count in sorted(node_types.items(), key=lambda x: x[1], reverse=True):
+                    for node_type, count in sorted(node_types.items(), key=itemgetter(1), reverse=True):
                         st.write(f"• {node_type}: {count}")
                 
                 with col2:
                     st.write("**Relationships by Type:**")
                     edge_types = stats.get('edge_types', {})
-                    for edge_type, count in sorted(edge_types.items(), key=lambda x: x[1], reverse=True)[:10]:
+                    for edge_type, count in nlargest(10, edge_types.items(), key=itemgetter(1)):
                         st.write(f"• {edge_type}: {count}")
         
         # Central nodes (most connected)
@@ -636,7 +874,7 @@ def knowledge_graph_page():
         
         with col1:
             st.write("**👥 Central People:**")
-            people_response = api_request("GET", "/graph/central-nodes?node_type=person&limit=5")
+            people_response = api_get("/graph/central-nodes", {"node_type": "person", "limit": 5})
             if people_response and people_response.get('central_nodes'):
                 for node in people_response['central_nodes']:
                     st.write(f"🔵 **{node['label']}** - {node['connections']} connections")
@@ -645,7 +883,7 @@ def knowledge_graph_page():
         
         with col2:
             st.write("**🎯 Central Topics:**")
-            topics_response = api_request("GET", "/graph/central-nodes?node_type=topic&limit=5")
+            topics_response = api_get("/graph/central-nodes", {"node_type": "topic", "limit": 5})
             if topics_response and topics_response.get('central_nodes'):
                 for node in topics_response['central_nodes']:
                     st.write(f"🔵 **{node['label']}** - {node['connections']} connections")
@@ -654,7 +892,7 @@ def knowledge_graph_page():
         
         # Topic clusters
         st.subheader("🌐 Topic Clusters")
-        clusters_response = api_request("GET", "/graph/clusters?node_type=topic")
+        clusters_response = api_get("/graph/clusters", {"node_type": "topic"})
         if clusters_response and clusters_response.get('clusters'):
             clusters = clusters_response['clusters']
             st.write(f"Found {len(clusters)} topic clusters")
@@ -666,16 +904,17 @@ def knowledge_graph_page():
         
         # Path finder
         st.subheader("🔍 Connection Explorer")
-        col1, col2, col3 = st.columns([2, 2, 1])
-        
-        with col1:
-            start_entity = st.text_input("From entity (e.g., person:John)", key="path_start")
-        with col2:
-            end_entity = st.text_input("To entity (e.g., topic:AI)", key="path_end")
-        with col3:
-            st.write("")
-            st.write("")
-            find_path = st.button("Find Path")
+        with st.form("path_finder"):
+            col1, col2, col3 = st.columns([2, 2, 1])
+            
+            with col1:
+                start_entity = st.text_input("From entity (e.g., person:John)", key="path_start")
+            with col2:
+                end_entity = st.text_input("To entity (e.g., topic:AI)", key="path_end")
+            with col3:
+                st.write("")
+                st.write("")
+                find_path = st.form_submit_button("Find Path")
         
         if find_path and start_entity and end_entity:
             path_response = api_request("GET", f"/graph/path?start={start_entity}&end={end_entity}")
@@ -692,7 +931,7 @@ def knowledge_graph_page():
         
         # Graph visualization (simple text-based for now)
         st.subheader("🎨 Visualization")
-        viz_response = api_request("GET", "/graph/visualize?limit=50")
+        viz_response = api_get("/graph/visualize", {"limit": 50})
         
         if viz_response and viz_response.get('graph'):
             graph_data = viz_response['graph']
@@ -703,29 +942,35 @@ def knowledge_graph_page():
             
             # Group by type
             with st.expander("View Graph Structure"):
+                # Only the first 10 labels per type are shown, so only keep those plus a count
                 by_type = defaultdict(list)
+                type_counts = defaultdict(int)
                 for node in nodes:
-                    by_type[node['type']].append(node['label'])
+                    node_type = node['type']
+                    type_counts[node_type] += 1
+                    if type_counts[node_type] <= 10:
+                        by_type[node_type].append(node['label'])
                 
                 for node_type, labels in by_type.items():
-                    st.write(f"**{node_type.capitalize()}s:** {', '.join(labels[:10])}")
-                    if len(labels) > 10:
-                        st.caption(f"...and {len(labels) - 10} more")
+                    st.write(f"**{node_type.capitalize()}s:** {', '.join(labels)}")
+                    if type_counts[node_type] > 10:
+                        st.caption(f"...and {type_counts[node_type] - 10} more")
         
         # Entity timeline
         st.subheader("📅 Entity Timeline")
-        entity_id = st.text_input("Enter entity ID (e.g., person:Sarah)", key="timeline_entity")
+        with st.form("entity_timeline"):
+            entity_id = st.text_input("Enter entity ID (e.g., person:Sarah)", key="timeline_entity")
+            show_timeline = st.form_submit_button("Show Timeline")
         
-        if entity_id and st.button("Show Timeline"):
+        if show_timeline and entity_id:
             timeline_response = api_request("GET", f"/graph/timeline/{entity_id}")
             if timeline_response and timeline_response.get('timeline'):
                 timeline = timeline_response['timeline']
                 
                 st.write(f"Found {len(timeline)} activities")
-                for event in timeline[:10]:
-                    st.write(f"**{event['date'][:10]}** - {event['type']}: {event['title']}")
-                    st.caption(f"_{event['relationship']}_: {event['content']}")
-                    st.divider()
+                df = pd.DataFrame(timeline[:10], columns=["date", "type", "title", "relationship", "content"])
+                df["date"] = df["date"].str[:10]
+                st.dataframe(df, hide_index=True, use_container_width=True)
             else:
                 st.info("No timeline found for this entity")
     
@@ -2,7 +2,9 @@
 MongoDB database connection and configuration
 """
 
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
+from pymongo.operations import SearchIndexModel
+from bson import ObjectId
 from beanie import init_beanie
 from config.settings import settings
 import logging
@@ -10,7 +12,10 @@ import logging
 logger = logging.getLogger(__name__)
 
 # Global database client
-db_client: AsyncIOMotorClient = None
+db_client: AsyncMongoClient = None
+
+# Atlas Vector Search index over Note.embeddings
+NOTE_VECTOR_INDEX = "note_vec"
 
 
 async def connect_db():
@@ -18,8 +23,15 @@ async def connect_db():
     global db_client
     
     try:
-        # Create MongoDB client
-        db_client = AsyncIOMotorClient(settings.MONGODB_URI)
+        # Native asyncio client - no executor hop per operation as with Motor
+        # tz_aware so stored datetimes come back comparable with the models' UTC defaults
+        # Warm pool floor so the summary/search fan-out does not pay connection setup per burst
+        db_client = AsyncMongoClient(
+            settings.MONGODB_URI,
+            maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+            minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+            tz_aware=True
+        )
         
         # Ping to verify connection
         await db_client.admin.command('ping')
@@ -35,18 +47,31 @@ async def connect_db():
         from models.reminder import Reminder
         from models.relationship import Relationship
         
+        document_models = [
+            User,
+            Note,
+            Person,
+            Meeting,
+            Reminder,
+            Relationship
+        ]
+        
+        # Rows the unique indexes would reject must be dealt with before init_beanie builds them
+        await dedupe_relationships(db)
+        duplicate_emails = await find_duplicate_emails(db)
+        
         # Initialize Beanie with all models
         await init_beanie(
             database=db,
-            document_models=[
-                User,
-                Note,
-                Person,
-                Meeting,
-                Reminder,
-                Relationship
-            ]
+            document_models=[model for model in document_models if not (duplicate_emails and model is User)]
         )
+        if duplicate_emails:
+            # Start without email_unique rather than fail - accounts are never merged automatically
+            await init_beanie(database=db, document_models=[User], skip_indexes=True)
+        
+        await warm_up_models(document_models)
+        
+        await ensure_vector_index(db)
         
         logger.info("Successfully connected to MongoDB")
         
@@ -55,12 +80,96 @@ async def connect_db():
         raise
 
 
+async def dedupe_relationships(db):
+    """
+    Keep one relationship per (user, source, target) so the rel_unique index can be built
+    Databases written before the index may hold racing duplicates - the strongest row of each is kept
+    """
+    if "rel_unique" in await db.relationships.index_information():
+        return
+    
+    cursor = await db.relationships.aggregate([
+        {"$sort": {"strength": -1, "updated_at": -1}},
+        {"$group": {
+            "_id": {"user_id": "$user_id", "source_id": "$source_id", "target_id": "$target_id"},
+            "ids": {"$push": "$_id"}
+        }},
+        {"$match": {"ids.1": {"$exists": True}}}
+    ], allowDiskUse=True)
+    stale = [rel_id for group in await cursor.to_list() for rel_id in group["ids"][1:]]
+    
+    if stale:
+        result = await db.relationships.delete_many({"_id": {"$in": stale}})
+        logger.warning(f"Removed {result.deleted_count} duplicate relationships before building rel_unique")
+
+
+async def find_duplicate_emails(db):
+    """
+    Emails held by more than one user - the email_unique index cannot be built while any exist
+    Registrations before the index checked with a racing find_one, so older databases may have some
+    """
+    if "email_unique" in await db.users.index_information():
+        return []
+    
+    cursor = await db.users.aggregate([
+        {"$group": {"_id": "$email", "count": {"$sum": 1}}},
+        {"$match": {"count": {"$gt": 1}}}
+    ])
+    duplicates = [group["_id"] for group in await cursor.to_list()]
+    
+    if duplicates:
+        logger.error(
+            f"Skipping the email_unique index: {len(duplicates)} emails belong to several users "
+            f"({', '.join(duplicates[:10])}). Merge or delete the extra accounts in the users "
+            f"collection and restart - until then registration does not reject reused emails."
+        )
+    return duplicates
+
+
+async def warm_up_models(document_models):
+    """Build validators and open pooled connections now rather than on the first request"""
+    for model in document_models:
+        model.model_rebuild()
+        # Touching these materializes the pydantic-core validator and serializer
+        model.__pydantic_validator__
+        model.__pydantic_serializer__
+        # A miss on a fresh id exercises the full query path without returning data
+        await model.find_one({"_id": ObjectId()})
+
+
+async def ensure_vector_index(db):
+    """Create the HNSW vector index for note search where the server supports it"""
+    index = SearchIndexModel(
+        name=NOTE_VECTOR_INDEX,
+        type="vectorSearch",
+        definition={
+            "fields": [
+                {
+                    "type": "vector",
+                    "path": "embeddings",
+                    "numDimensions": settings.EMBEDDING_DIMENSIONS,
+                    "similarity": "cosine"
+                },
+                {"type": "filter", "path": "user_id"}
+            ]
+        }
+    )
+    try:
+        existing = await (await db.notes.list_search_indexes(NOTE_VECTOR_INDEX)).to_list()
+        if not existing:
+            await db.notes.create_search_index(index)
+            logger.info("Created vector search index on notes")
+    except Exception as e:
+        # Plain mongod has no search indexes - note search falls back to an in-process scan
+        logger.info(f"Vector search unavailable, using in-process similarity: {e}")
+
+
 async def close_db():
     """Close MongoDB connection"""
     global db_client
     
     if db_client:
-        db_client.close()
+        await db_client.close()
         logger.info("Closed MongoDB connection")
 
 
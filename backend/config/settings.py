@@ -21,6 +21,8 @@ class Settings(BaseSettings):
     
     # Database
     MONGODB_URI: str = os.getenv("MONGODB_URI", "mongodb://localhost:27017/rumee")
+    MONGODB_MAX_POOL_SIZE: int = int(os.getenv("MONGODB_MAX_POOL_SIZE", "100"))
+    MONGODB_MIN_POOL_SIZE: int = int(os.getenv("MONGODB_MIN_POOL_SIZE", "10"))
     
     # JWT
     JWT_SECRET: str = os.getenv("JWT_SECRET", "your-secret-key-change-in-production")
@@ -31,6 +33,13 @@ class Settings(BaseSettings):
     OLLAMA_HOST: str = os.getenv("OLLAMA_HOST", "http://localhost:11434")
     OLLAMA_MODEL: str = os.getenv("OLLAMA_MODEL", "llama3.2:latest")
     OLLAMA_EMBEDDING_MODEL: str = os.getenv("OLLAMA_EMBEDDING_MODEL", "embeddinggemma:latest")
+    OLLAMA_TIMEOUT: float = float(os.getenv("OLLAMA_TIMEOUT", "120"))
+    OLLAMA_EMBED_BATCH_SIZE: int = int(os.getenv("OLLAMA_EMBED_BATCH_SIZE", "32"))
+    # Should match the server's OLLAMA_NUM_PARALLEL - extra in-flight requests only queue there
+    OLLAMA_NUM_PARALLEL: int = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+    EMBEDDING_DIMENSIONS: int = int(os.getenv("EMBEDDING_DIMENSIONS", "768"))
+    # Default executor for remaining blocking calls (sync Ollama client, file I/O) - asyncio's own caps at cpu_count + 4
+    AI_THREAD_POOL_SIZE: int = int(os.getenv("AI_THREAD_POOL_SIZE", "64"))
     
     # CORS
     CORS_ORIGINS: List[str] = [
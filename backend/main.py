@@ -5,10 +5,13 @@ AI-powered assistant for notes, meetings, reminders, and data linking
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 import uvicorn
 from config.database import connect_db, close_db
 from config.settings import settings
+from services.ollama_client import ai_executor
 from routes import notes, people, meetings, reminders, auth, summary, knowledge_graph
 import logging
 
@@ -25,6 +28,7 @@ async def lifespan(app: FastAPI):
     """Lifespan events for startup and shutdown"""
     # Startup
     logger.info("Starting Rumee Backend...")
+    asyncio.get_running_loop().set_default_executor(ai_executor)
     await connect_db()
     logger.info("Connected to MongoDB")
     yield
@@ -39,7 +43,8 @@ app = FastAPI(
     title="Rumee API",
     description="AI-powered assistant for notes, meetings, reminders, and data linking",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
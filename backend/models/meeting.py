@@ -3,9 +3,12 @@ Meeting model for scheduling and notes
 """
 
 from beanie import Document, PydanticObjectId
-from pydantic import Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
+
+_utcnow = partial(datetime.now, timezone.utc)
 
 
 class Meeting(Document):
@@ -24,8 +27,8 @@ class Meeting(Document):
     action_items: List[dict] = Field(default_factory=list)
     linked_notes: List[PydanticObjectId] = Field(default_factory=list)
     status: str = "scheduled"  # scheduled, completed, cancelled
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
     
     class Settings:
         name = "meetings"
@@ -35,8 +38,8 @@ class Meeting(Document):
             [("user_id", 1), ("scheduled_at", -1)],
         ]
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "title": "Project Kickoff Meeting",
                 "scheduled_at": "2024-01-15T10:00:00Z",
@@ -48,3 +51,16 @@ class Meeting(Document):
                 "status": "scheduled"
             }
         }
+    )
+
+
+class MeetingListView(BaseModel):
+    """Projection for meeting lists - skips notes, agenda and action items"""
+    id: PydanticObjectId = Field(alias="_id")
+    title: str
+    scheduled_at: datetime
+    duration_minutes: Optional[int] = None
+    status: str = "scheduled"
+    participants: List[PydanticObjectId] = Field(default_factory=list)
+    
+    model_config = ConfigDict(populate_by_name=True)
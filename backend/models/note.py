@@ -3,9 +3,23 @@ Note model with AI embeddings and entity linking
 """
 
 from beanie import Document, PydanticObjectId
-from pydantic import Field
-from typing import List, Optional
-from datetime import datetime
+from bson.binary import Binary, BinaryVectorDtype
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import List, Optional, Sequence
+from datetime import datetime, timezone
+from functools import partial
+import numpy as np
+
+_utcnow = partial(datetime.now, timezone.utc)
+
+
+def pack_embedding(vector: Sequence[float]) -> Optional[Binary]:
+    """Pack an embedding as a BSON float32 vector (Binary subtype 9)"""
+    if vector is None or len(vector) == 0:
+        return None
+    return Binary.from_vector(
+        np.asarray(vector, dtype=np.float32).tolist(), BinaryVectorDtype.FLOAT32
+    )
 
 
 class Note(Document):
@@ -14,13 +28,14 @@ class Note(Document):
     user_id: PydanticObjectId
     title: str
     content: str
-    embeddings: List[float] = Field(default_factory=list)
+    embeddings: Optional[Binary] = None  # float32 vector, ~4 bytes per dimension
+    embedding_norm: Optional[float] = None  # L2 norm, computed once at write time
     tags: List[str] = Field(default_factory=list)
     linked_people: List[PydanticObjectId] = Field(default_factory=list)
     linked_meetings: List[PydanticObjectId] = Field(default_factory=list)
     entities: dict = Field(default_factory=dict)  # Extracted entities
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
     
     class Settings:
         name = "notes"
@@ -30,8 +45,38 @@ class Note(Document):
             [("user_id", 1), ("created_at", -1)],
         ]
     
-    class Config:
-        json_schema_extra = {
+    @field_validator("embeddings", mode="before")
+    @classmethod
+    def _pack_legacy_embeddings(cls, value):
+        """Convert notes stored before the binary format (List[float]) on load"""
+        if isinstance(value, (list, tuple, np.ndarray)):
+            return pack_embedding(value)
+        return value
+    
+    def set_embedding(self, vector: Sequence[float]) -> None:
+        """Store an embedding in packed float32 form along with its norm"""
+        self.embeddings = pack_embedding(vector)
+        self.embedding_norm = (
+            float(np.linalg.norm(np.asarray(vector, dtype=np.float32))) if self.embeddings else None
+        )
+    
+    def get_embedding(self) -> Optional[np.ndarray]:
+        """Unpack the stored embedding as a float32 array"""
+        if not self.embeddings:
+            return None
+        return np.asarray(self.embeddings.as_vector().data, dtype=np.float32)
+    
+    def get_unit_embedding(self) -> Optional[np.ndarray]:
+        """Stored embedding scaled to unit length, using the stored norm when there is one"""
+        vector = self.get_embedding()
+        if vector is None:
+            return None
+        norm = self.embedding_norm if self.embedding_norm is not None else np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        json_schema_extra={
             "example": {
                 "title": "Meeting with Sarah",
                 "content": "Discussed project timeline and deliverables",
@@ -42,3 +87,16 @@ class Note(Document):
                 }
             }
         }
+    )
+
+
+class NoteListView(BaseModel):
+    """Projection for note lists - skips embeddings and link arrays"""
+    id: PydanticObjectId = Field(alias="_id")
+    title: str
+    content: str
+    tags: List[str] = Field(default_factory=list)
+    entities: dict = Field(default_factory=dict)
+    created_at: datetime
+    
+    model_config = ConfigDict(populate_by_name=True)
@@ -3,9 +3,12 @@ Person/Contact model for relationship management
 """
 
 from beanie import Document, PydanticObjectId
-from pydantic import Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
+
+_utcnow = partial(datetime.now, timezone.utc)
 
 
 class Person(Document):
@@ -22,8 +25,8 @@ class Person(Document):
     linked_notes: List[PydanticObjectId] = Field(default_factory=list)
     linked_meetings: List[PydanticObjectId] = Field(default_factory=list)
     last_contact: Optional[datetime] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
     
     class Settings:
         name = "people"
@@ -33,8 +36,8 @@ class Person(Document):
             [("user_id", 1), ("name", 1)],
         ]
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "Sarah Johnson",
                 "email": "sarah@example.com",
@@ -43,3 +46,17 @@ class Person(Document):
                 "tags": ["colleague", "project-lead"]
             }
         }
+    )
+
+
+class PersonListView(BaseModel):
+    """Projection for people lists - skips linked note/meeting arrays"""
+    id: PydanticObjectId = Field(alias="_id")
+    name: str
+    email: Optional[EmailStr] = None
+    company: Optional[str] = None
+    role: Optional[str] = None
+    tags: List[str] = Field(default_factory=list)
+    last_contact: Optional[datetime] = None
+    
+    model_config = ConfigDict(populate_by_name=True)
@@ -3,9 +3,13 @@ Relationship model for knowledge graph connections
 """
 
 from beanie import Document, PydanticObjectId
-from pydantic import Field
+from pydantic import ConfigDict, Field
 from typing import Optional, Literal
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
+from pymongo import IndexModel, ASCENDING
+
+_utcnow = partial(datetime.now, timezone.utc)
 
 
 RelationshipType = Literal[
@@ -30,8 +34,8 @@ class Relationship(Document):
     relationship_type: RelationshipType
     strength: float = Field(ge=0.0, le=1.0, default=0.5)  # Confidence score
     metadata: dict = Field(default_factory=dict)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
     
     class Settings:
         name = "relationships"
@@ -42,10 +46,15 @@ class Relationship(Document):
             [("user_id", 1), ("source_id", 1)],
             [("user_id", 1), ("target_id", 1)],
             [("source_id", 1), ("target_id", 1)],
+            IndexModel(
+                [("user_id", ASCENDING), ("source_id", ASCENDING), ("target_id", ASCENDING)],
+                unique=True,
+                name="rel_unique"
+            ),
         ]
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "source_type": "note",
                 "target_type": "person",
@@ -56,4 +65,7 @@ class Relationship(Document):
                     "context": "Project discussion"
                 }
             }
-        }
+        },
+        extra="ignore",
+        validate_assignment=False
+    )
@@ -3,9 +3,12 @@ Reminder model for tasks and notifications
 """
 
 from beanie import Document, PydanticObjectId
-from pydantic import Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
+
+_utcnow = partial(datetime.now, timezone.utc)
 
 
 class Reminder(Document):
@@ -21,7 +24,7 @@ class Reminder(Document):
     linked_meeting: Optional[PydanticObjectId] = None
     linked_person: Optional[PydanticObjectId] = None
     recurrence: Optional[str] = None  # daily, weekly, monthly
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
     completed_at: Optional[datetime] = None
     
     class Settings:
@@ -31,11 +34,11 @@ class Reminder(Document):
             "due_date",
             "status",
             [("user_id", 1), ("due_date", 1)],
-            [("user_id", 1), ("status", 1)],
+            [("user_id", 1), ("status", 1), ("due_date", 1)],
         ]
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "title": "Review project proposal",
                 "description": "Review and provide feedback on Q1 proposal",
@@ -44,3 +47,17 @@ class Reminder(Document):
                 "status": "pending"
             }
         }
+    )
+
+
+class ReminderListView(BaseModel):
+    """Projection for reminder lists - skips link and recurrence fields"""
+    id: PydanticObjectId = Field(alias="_id")
+    title: str
+    description: Optional[str] = None
+    due_date: datetime
+    priority: str = "medium"
+    status: str = "pending"
+    created_at: datetime
+    
+    model_config = ConfigDict(populate_by_name=True)
@@ -3,12 +3,16 @@ User model for authentication and preferences
 """
 
 from beanie import Document
-from pydantic import EmailStr, Field
+from pydantic import ConfigDict, EmailStr, Field
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from passlib.context import CryptContext
+from pymongo import IndexModel, ASCENDING
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
+
+_utcnow = partial(datetime.now, timezone.utc)
 
 
 class User(Document):
@@ -17,13 +21,15 @@ class User(Document):
     email: EmailStr = Field(..., unique=True)
     password_hash: str
     name: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
     last_login: Optional[datetime] = None
     preferences: dict = Field(default_factory=dict)
     
     class Settings:
         name = "users"
-        indexes = ["email"]
+        indexes = [
+            IndexModel([("email", ASCENDING)], unique=True, name="email_unique"),
+        ]
     
     def verify_password(self, password: str) -> bool:
         """Verify password against hash"""
@@ -34,8 +40,8 @@ class User(Document):
         """Hash a password"""
         return pwd_context.hash(password)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "user@example.com",
                 "name": "John Doe",
@@ -45,3 +51,4 @@ class User(Document):
                 }
             }
         }
+    )
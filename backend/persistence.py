@@ -3,8 +3,10 @@ Simple file-based persistence for test server
 Stores data in JSON files
 """
 
+import asyncio
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Dict, Any
 import logging
@@ -14,9 +16,14 @@ logger = logging.getLogger(__name__)
 class SimplePersistence:
     """Simple JSON file-based persistence"""
     
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", flush_interval: float = 0.5):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
+        self.flush_interval = flush_interval
+        # Stores changed since the last flush, by name
+        self._dirty: Dict[str, Dict[str, Any]] = {}
+        self._dirty_lock = threading.Lock()
+        self._flush_task = None
         
     def _get_file_path(self, name: str) -> Path:
         """Get file path for a data store"""
@@ -43,9 +50,13 @@ class SimplePersistence:
         """Save data to file"""
         file_path = self._get_file_path(name)
         
+        tmp_path = file_path.with_suffix(".json.tmp")
+        
         try:
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            # Compact output, written aside and renamed so readers never see a partial file
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, separators=(',', ':'), default=str)
+            os.replace(tmp_path, file_path)
             return True
         except Exception as e:
             logger.error(f"Error saving {name}: {e}")
@@ -59,6 +70,41 @@ class SimplePersistence:
                 success = False
         return success
 
+    
+    def mark_dirty(self, name: str, data: Dict[str, Any]) -> None:
+        """Queue a store for the next background flush (safe from any thread)"""
+        if self._flush_task is None:
+            # Flusher not running yet - write through
+            self.save(name, data)
+            return
+        with self._dirty_lock:
+            self._dirty[name] = data
+    
+    def flush(self) -> bool:
+        """Write every store marked dirty since the last flush"""
+        with self._dirty_lock:
+            dirty, self._dirty = self._dirty, {}
+        return self.save_all(dirty)
+    
+    def start(self):
+        """Start the background flusher on the running event loop"""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+    
+    async def stop(self):
+        """Stop the flusher and write anything still pending"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self.flush()
+    
+    async def _flush_loop(self):
+        """Coalesce mutations into at most one write per store per interval"""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if self._dirty:
+                self.flush()
+
 
 # Global persistence instance
 persistence = SimplePersistence()
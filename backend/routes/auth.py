@@ -6,14 +6,28 @@ from fastapi import APIRouter, HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, EmailStr
 from models.user import User
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import jwt
+import asyncio
+import hashlib
+import time
+from cachetools import TTLCache
 from config.settings import settings
 from beanie import PydanticObjectId
+from pymongo.errors import DuplicateKeyError
 
 router = APIRouter()
 security = HTTPBearer()
 
+# Token codec built once - the secret never rotates at runtime
+_jwt = jwt.PyJWT()
+_JWT_SECRET = settings.JWT_SECRET.encode()
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+_JWT_DECODE_OPTIONS = {"require": ["exp"], "verify_exp": True}
+
+# Recently verified tokens -> (user, exp) so bursts skip the HMAC check and the Mongo lookup
+_auth_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
 
 class RegisterRequest(BaseModel):
     email: EmailStr
@@ -34,21 +48,30 @@ class TokenResponse(BaseModel):
 
 def create_token(user_id: str) -> str:
     """Create JWT token"""
-    expiration = datetime.utcnow() + timedelta(days=settings.JWT_EXPIRATION_DAYS)
+    expiration = datetime.now(timezone.utc) + timedelta(days=settings.JWT_EXPIRATION_DAYS)
     payload = {
         "user_id": user_id,
         "exp": expiration
     }
-    return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    return _jwt.encode(payload, _JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
 
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> User:
     """Get current authenticated user"""
+    cache_key = hashlib.blake2b(credentials.credentials.encode(), digest_size=16).digest()
+    cached = _auth_cache.get(cache_key)
+    if cached is not None:
+        user, expires_at = cached
+        if expires_at > time.time():
+            return user
+        _auth_cache.pop(cache_key, None)
+    
     try:
-        payload = jwt.decode(
+        payload = _jwt.decode(
             credentials.credentials,
-            settings.JWT_SECRET,
-            algorithms=[settings.JWT_ALGORITHM]
+            _JWT_SECRET,
+            algorithms=_JWT_ALGORITHMS,
+            options=_JWT_DECODE_OPTIONS
         )
         user_id = payload.get("user_id")
         if not user_id:
@@ -58,6 +81,7 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         if not user:
             raise HTTPException(status_code=401, detail="User not found")
         
+        _auth_cache[cache_key] = (user, payload["exp"])
         return user
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
@@ -68,18 +92,17 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
 @router.post("/register", response_model=TokenResponse)
 async def register(request: RegisterRequest):
     """Register a new user"""
-    # Check if user exists
-    existing = await User.find_one(User.email == request.email)
-    if existing:
-        raise HTTPException(status_code=400, detail="Email already registered")
-    
-    # Create user
+    # Create user - the unique email index rejects duplicates in the same round trip
     user = User(
         email=request.email,
-        password_hash=User.hash_password(request.password),
+        # bcrypt is deliberately slow - keep it off the event loop
+        password_hash=await asyncio.to_thread(User.hash_password, request.password),
         name=request.name
     )
-    await user.save()
+    try:
+        await user.insert()
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already registered")
     
     # Create token
     token = create_token(str(user.id))
@@ -98,11 +121,11 @@ async def register(request: RegisterRequest):
 async def login(request: LoginRequest):
     """Login user"""
     user = await User.find_one(User.email == request.email)
-    if not user or not user.verify_password(request.password):
+    if not user or not await asyncio.to_thread(user.verify_password, request.password):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     # Update last login
-    user.last_login = datetime.utcnow()
+    user.last_login = datetime.now(timezone.utc)
     await user.save()
     
     # Create token
@@ -3,6 +3,7 @@ Knowledge Graph routes
 """
 
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from models.user import User
 from routes.auth import get_current_user
 from services.knowledge_graph_service import knowledge_graph_service
@@ -13,28 +14,30 @@ router = APIRouter()
 
 @router.get("/full")
 async def get_full_graph(current_user: User = Depends(get_current_user)):
-    """Get complete knowledge graph for user"""
-    graph = await knowledge_graph_service.build_knowledge_graph(current_user.id)
-    return graph
+    """Get complete knowledge graph for user, streamed as it is read"""
+    return StreamingResponse(
+        knowledge_graph_service.stream_knowledge_graph(current_user.id),
+        media_type="application/json"
+    )
 
 
 @router.get("/entity/{entity_id}/connections")
-async def get_entity_connections(entity_id: str, depth: int = 2, current_user: User = Depends(get_current_user)):
+async def get_entity_connections(entity_id: PydanticObjectId, depth: int = 2, current_user: User = Depends(get_current_user)):
     """Get connections for a specific entity"""
     connections = await knowledge_graph_service.get_entity_connections(
-        PydanticObjectId(entity_id),
+        entity_id,
         current_user.id,
         depth
     )
-    return {"entity_id": entity_id, "connections": connections}
+    return {"entity_id": str(entity_id), "connections": connections}
 
 
 @router.get("/entity/{entity_id}/mindmap")
-async def get_entity_mindmap(entity_id: str, current_user: User = Depends(get_current_user)):
+async def get_entity_mindmap(entity_id: PydanticObjectId, current_user: User = Depends(get_current_user)):
     """Get mind map centered on a specific entity"""
     mindmap = await knowledge_graph_service.get_mind_map(
         current_user.id,
-        PydanticObjectId(entity_id)
+        entity_id
     )
     return mindmap
 
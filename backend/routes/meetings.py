@@ -2,15 +2,15 @@
 Meetings routes
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
 from pydantic import BaseModel
-from models.meeting import Meeting
+from models.meeting import Meeting, MeetingListView
 from models.user import User
 from routes.auth import get_current_user
 from services.data_linking_service import data_linking_service
 from typing import List, Optional
 from datetime import datetime
-from beanie import PydanticObjectId
+from beanie import PydanticObjectId, UpdateResponse
 
 router = APIRouter()
 
@@ -23,7 +23,7 @@ class MeetingCreate(BaseModel):
     location: Optional[str] = None
     meeting_link: Optional[str] = None
     agenda: Optional[str] = None
-    participant_ids: List[str] = []
+    participant_ids: List[PydanticObjectId] = []
 
 
 class MeetingUpdate(BaseModel):
@@ -36,7 +36,7 @@ class MeetingUpdate(BaseModel):
 
 
 @router.post("")
-async def create_meeting(meeting_data: MeetingCreate, current_user: User = Depends(get_current_user)):
+async def create_meeting(meeting_data: MeetingCreate, background_tasks: BackgroundTasks, current_user: User = Depends(get_current_user)):
     """Create a new meeting"""
     meeting = Meeting(
         user_id=current_user.id,
@@ -47,12 +47,12 @@ async def create_meeting(meeting_data: MeetingCreate, current_user: User = Depen
         location=meeting_data.location,
         meeting_link=meeting_data.meeting_link,
         agenda=meeting_data.agenda,
-        participants=[PydanticObjectId(p_id) for p_id in meeting_data.participant_ids]
+        participants=meeting_data.participant_ids
     )
     await meeting.save()
     
-    # Link to related notes
-    await data_linking_service.link_meeting_to_notes(meeting)
+    # Link to related notes after the response is sent
+    background_tasks.add_task(data_linking_service.link_meeting_to_notes, meeting)
     
     return {
         "id": str(meeting.id),
@@ -65,10 +65,11 @@ async def create_meeting(meeting_data: MeetingCreate, current_user: User = Depen
 @router.get("")
 async def get_meetings(current_user: User = Depends(get_current_user)):
     """Get all meetings for current user"""
-    meetings = await Meeting.find(
+    query = Meeting.find(
         Meeting.user_id == current_user.id
-    ).sort("-scheduled_at").to_list()
+    ).sort("-scheduled_at").project(MeetingListView)
     
+    # Build the response straight off the cursor - no intermediate document list
     return [
         {
             "id": str(meeting.id),
@@ -78,62 +79,107 @@ async def get_meetings(current_user: User = Depends(get_current_user)):
             "status": meeting.status,
             "participants": [str(p) for p in meeting.participants]
         }
-        for meeting in meetings
+        async for meeting in query
     ]
 
 
 @router.get("/{meeting_id}")
-async def get_meeting(meeting_id: str, current_user: User = Depends(get_current_user)):
-    """Get a specific meeting"""
-    meeting = await Meeting.get(PydanticObjectId(meeting_id))
-    if not meeting or meeting.user_id != current_user.id:
+async def get_meeting(meeting_id: PydanticObjectId, current_user: User = Depends(get_current_user)):
+    """Get a specific meeting with its participants and linked notes joined in"""
+    # One round trip instead of a lookup per participant and per linked note
+    results = await Meeting.aggregate([
+        {"$match": {"_id": meeting_id, "user_id": current_user.id}},
+        {"$lookup": {
+            "from": "people",
+            "localField": "participants",
+            "foreignField": "_id",
+            "as": "participants_full",
+            "pipeline": [{"$project": {"name": 1, "email": 1, "company": 1}}]
+        }},
+        {"$lookup": {
+            "from": "notes",
+            "localField": "linked_notes",
+            "foreignField": "_id",
+            "as": "notes_full",
+            "pipeline": [{"$project": {"title": 1, "created_at": 1}}]
+        }}
+    ]).to_list()
+    if not results:
         raise HTTPException(status_code=404, detail="Meeting not found")
+    meeting = results[0]
     
     return {
-        "id": str(meeting.id),
-        "title": meeting.title,
-        "description": meeting.description,
-        "scheduled_at": meeting.scheduled_at,
-        "duration_minutes": meeting.duration_minutes,
-        "location": meeting.location,
-        "meeting_link": meeting.meeting_link,
-        "agenda": meeting.agenda,
-        "notes": meeting.notes,
-        "action_items": meeting.action_items,
-        "participants": [str(p) for p in meeting.participants],
-        "linked_notes": [str(n) for n in meeting.linked_notes],
-        "status": meeting.status,
-        "created_at": meeting.created_at
+        "id": str(meeting["_id"]),
+        "title": meeting["title"],
+        "description": meeting.get("description"),
+        "scheduled_at": meeting["scheduled_at"],
+        "duration_minutes": meeting.get("duration_minutes"),
+        "location": meeting.get("location"),
+        "meeting_link": meeting.get("meeting_link"),
+        "agenda": meeting.get("agenda"),
+        "notes": meeting.get("notes"),
+        "action_items": meeting.get("action_items", []),
+        "participants": [str(p) for p in meeting.get("participants", [])],
+        "participant_details": [
+            {
+                "id": str(person["_id"]),
+                "name": person.get("name"),
+                "email": person.get("email"),
+                "company": person.get("company")
+            }
+            for person in meeting["participants_full"]
+        ],
+        "linked_notes": [str(n) for n in meeting.get("linked_notes", [])],
+        "linked_note_details": [
+            {
+                "id": str(note["_id"]),
+                "title": note.get("title"),
+                "created_at": note.get("created_at")
+            }
+            for note in meeting["notes_full"]
+        ],
+        "status": meeting.get("status", "scheduled"),
+        "created_at": meeting.get("created_at")
     }
 
 
 @router.put("/{meeting_id}")
-async def update_meeting(meeting_id: str, meeting_data: MeetingUpdate, current_user: User = Depends(get_current_user)):
+async def update_meeting(meeting_id: PydanticObjectId, meeting_data: MeetingUpdate, background_tasks: BackgroundTasks, current_user: User = Depends(get_current_user)):
     """Update a meeting"""
-    meeting = await Meeting.get(PydanticObjectId(meeting_id))
-    if not meeting or meeting.user_id != current_user.id:
-        raise HTTPException(status_code=404, detail="Meeting not found")
-    
+    query = Meeting.find_one(
+        Meeting.id == meeting_id,
+        Meeting.user_id == current_user.id
+    )
     update_data = meeting_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(meeting, field, value)
-    
-    await meeting.save()
     
-    # If action items were updated, create reminders
+    # Only the changed fields are written, in one round trip
     if meeting_data.action_items is not None:
-        await data_linking_service.create_reminders_from_action_items(meeting)
+        # Reminder creation needs the document, so get it back from the same update
+        meeting = await query.update({"$set": update_data}, response_type=UpdateResponse.NEW_DOCUMENT)
+        if not meeting:
+            raise HTTPException(status_code=404, detail="Meeting not found")
+        background_tasks.add_task(data_linking_service.create_reminders_from_action_items, meeting)
+    else:
+        if update_data:
+            result = await query.update({"$set": update_data})
+            found = bool(result and result.matched_count)
+        else:
+            found = await query is not None
+        if not found:
+            raise HTTPException(status_code=404, detail="Meeting not found")
     
-    return {"message": "Meeting updated", "id": str(meeting.id)}
+    return {"message": "Meeting updated", "id": str(meeting_id)}
 
 
 @router.delete("/{meeting_id}")
-async def delete_meeting(meeting_id: str, current_user: User = Depends(get_current_user)):
+async def delete_meeting(meeting_id: PydanticObjectId, current_user: User = Depends(get_current_user)):
     """Delete a meeting"""
-    meeting = await Meeting.get(PydanticObjectId(meeting_id))
-    if not meeting or meeting.user_id != current_user.id:
+    # Ownership is part of the filter - one server-side delete, no fetch
+    result = await Meeting.find_one(
+        Meeting.id == meeting_id,
+        Meeting.user_id == current_user.id
+    ).delete()
+    if not result or not result.deleted_count:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
-    await meeting.delete()
-    
     return {"message": "Meeting deleted"}
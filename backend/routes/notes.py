@@ -2,18 +2,31 @@
 Notes routes
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
 from pydantic import BaseModel
 from beanie import PydanticObjectId
-from models.note import Note
+from pymongo.errors import OperationFailure
+from config.database import NOTE_VECTOR_INDEX
+from models.note import Note, NoteListView
 from models.user import User
 from routes.auth import get_current_user
 from services.ai_service import ai_service
 from services.data_linking_service import data_linking_service
 from typing import List, Optional
+from collections import deque
+from cachetools import TTLCache
+import hashlib
+import numpy as np
 
 router = APIRouter()
 
+# Search caches - exact query string, then near-duplicate query embeddings
+SEARCH_CACHE_TTL = 300
+SEMANTIC_CACHE_THRESHOLD = 0.97
+RECENT_SEARCHES_PER_USER = 32
+_search_results: TTLCache = TTLCache(maxsize=1024, ttl=SEARCH_CACHE_TTL)
+_recent_searches: TTLCache = TTLCache(maxsize=1024, ttl=SEARCH_CACHE_TTL)
+
 
 class NoteCreate(BaseModel):
     title: str
@@ -28,7 +41,7 @@ class NoteUpdate(BaseModel):
 
 
 @router.post("")
-async def create_note(note_data: NoteCreate, current_user: User = Depends(get_current_user)):
+async def create_note(note_data: NoteCreate, background_tasks: BackgroundTasks, current_user: User = Depends(get_current_user)):
     """Create a new note with AI processing"""
     # Create note
     note = Note(
@@ -39,14 +52,15 @@ async def create_note(note_data: NoteCreate, current_user: User = Depends(get_cu
     )
     
     # Generate embeddings
-    note.embeddings = await ai_service.generate_embeddings(
+    note.set_embedding(await ai_service.generate_embeddings(
         f"{note.title}\n{note.content}"
-    )
+    ))
     
     await note.save()
+    _invalidate_search_cache(current_user.id)
     
-    # Link to entities in background
-    await data_linking_service.link_note_to_entities(note)
+    # Link to entities after the response is sent
+    background_tasks.add_task(data_linking_service.link_note_to_entities, note)
     
     return {
         "id": str(note.id),
@@ -58,13 +72,55 @@ async def create_note(note_data: NoteCreate, current_user: User = Depends(get_cu
     }
 
 
+@router.post("/batch")
+async def create_notes_batch(notes_data: List[NoteCreate], background_tasks: BackgroundTasks, current_user: User = Depends(get_current_user)):
+    """Create several notes at once, embedding them in batched Ollama calls"""
+    notes = [
+        Note(
+            user_id=current_user.id,
+            title=note_data.title,
+            content=note_data.content,
+            tags=note_data.tags
+        )
+        for note_data in notes_data
+    ]
+    
+    embeddings = await ai_service.generate_embeddings_batch(
+        [f"{note.title}\n{note.content}" for note in notes]
+    )
+    for note, embedding in zip(notes, embeddings):
+        note.set_embedding(embedding)
+    
+    # One insert for the whole batch - insert_many does not write the generated ids back onto the documents
+    inserted_ids = (await Note.insert_many(notes)).inserted_ids if notes else []
+    for note, note_id in zip(notes, inserted_ids):
+        note.id = note_id
+        background_tasks.add_task(data_linking_service.link_note_to_entities, note)
+    _invalidate_search_cache(current_user.id)
+    
+    return [
+        {
+            "id": str(note.id),
+            "title": note.title,
+            "content": note.content,
+            "tags": note.tags,
+            "entities": note.entities,
+            "created_at": note.created_at
+        }
+        for note in notes
+    ]
+
+
 @router.get("")
-async def get_notes(current_user: User = Depends(get_current_user)):
-    """Get all notes for current user"""
-    notes = await Note.find(
+async def get_notes(limit: Optional[int] = None, current_user: User = Depends(get_current_user)):
+    """Get notes for current user, newest first (optionally only the latest `limit`)"""
+    query = Note.find(
         Note.user_id == current_user.id
-    ).sort("-created_at").to_list()
+    ).sort("-created_at").project(NoteListView)
+    if limit:
+        query = query.limit(limit)
     
+    # Build the response straight off the cursor - no intermediate document list
     return [
         {
             "id": str(note.id),
@@ -74,35 +130,87 @@ async def get_notes(current_user: User = Depends(get_current_user)):
             "entities": note.entities,
             "created_at": note.created_at
         }
-        for note in notes
+        async for note in query
     ]
 
 
 @router.get("/{note_id}")
-async def get_note(note_id: str, current_user: User = Depends(get_current_user)):
-    """Get a specific note"""
-    note = await Note.get(PydanticPydanticObjectId(note_id))
-    if not note or note.user_id != current_user.id:
+async def get_note(note_id: PydanticObjectId, current_user: User = Depends(get_current_user)):
+    """Get a specific note with its linked people and meetings joined in"""
+    # One round trip instead of a lookup per linked entity
+    results = await Note.aggregate([
+        {"$match": {"_id": note_id, "user_id": current_user.id}},
+        {"$project": {"embeddings": 0}},
+        {"$lookup": {
+            "from": "people",
+            "localField": "linked_people",
+            "foreignField": "_id",
+            "as": "people_full",
+            "pipeline": [{"$project": {"name": 1, "email": 1, "company": 1}}]
+        }},
+        {"$lookup": {
+            "from": "meetings",
+            "localField": "linked_meetings",
+            "foreignField": "_id",
+            "as": "meetings_full",
+            "pipeline": [{"$project": {"title": 1, "scheduled_at": 1}}]
+        }}
+    ]).to_list()
+    if not results:
         raise HTTPException(status_code=404, detail="Note not found")
+    note = results[0]
     
     return {
-        "id": str(note.id),
-        "title": note.title,
-        "content": note.content,
-        "tags": note.tags,
-        "entities": note.entities,
-        "linked_people": [str(p) for p in note.linked_people],
-        "linked_meetings": [str(m) for m in note.linked_meetings],
-        "created_at": note.created_at,
-        "updated_at": note.updated_at
+        "id": str(note["_id"]),
+        "title": note["title"],
+        "content": note["content"],
+        "tags": note.get("tags", []),
+        "entities": note.get("entities", {}),
+        "linked_people": [str(p) for p in note.get("linked_people", [])],
+        "linked_people_details": [
+            {
+                "id": str(person["_id"]),
+                "name": person.get("name"),
+                "email": person.get("email"),
+                "company": person.get("company")
+            }
+            for person in note["people_full"]
+        ],
+        "linked_meetings": [str(m) for m in note.get("linked_meetings", [])],
+        "linked_meeting_details": [
+            {
+                "id": str(meeting["_id"]),
+                "title": meeting.get("title"),
+                "scheduled_at": meeting.get("scheduled_at")
+            }
+            for meeting in note["meetings_full"]
+        ],
+        "created_at": note.get("created_at"),
+        "updated_at": note.get("updated_at")
     }
 
 
 @router.put("/{note_id}")
-async def update_note(note_id: str, note_data: NoteUpdate, current_user: User = Depends(get_current_user)):
+async def update_note(note_id: PydanticObjectId, note_data: NoteUpdate, background_tasks: BackgroundTasks, current_user: User = Depends(get_current_user)):
     """Update a note"""
-    note = await Note.get(PydanticPydanticObjectId(note_id))
-    if not note or note.user_id != current_user.id:
+    query = Note.find_one(
+        Note.id == note_id,
+        Note.user_id == current_user.id
+    )
+    
+    if note_data.title is None and note_data.content is None:
+        # Tags-only edits need no re-embedding - write just that field
+        if note_data.tags is not None:
+            result = await query.update({"$set": {"tags": note_data.tags}})
+            found = bool(result and result.matched_count)
+        else:
+            found = await query is not None
+        if not found:
+            raise HTTPException(status_code=404, detail="Note not found")
+        return {"message": "Note updated", "id": str(note_id)}
+    
+    note = await query
+    if not note:
         raise HTTPException(status_code=404, detail="Note not found")
     
     if note_data.title is not None:
@@ -114,56 +222,152 @@ async def update_note(note_id: str, note_data: NoteUpdate, current_user: User =
     
     # Regenerate embeddings if content changed
     if note_data.title is not None or note_data.content is not None:
-        note.embeddings = await ai_service.generate_embeddings(
+        note.set_embedding(await ai_service.generate_embeddings(
             f"{note.title}\n{note.content}"
-        )
-        await data_linking_service.link_note_to_entities(note)
+        ))
+        background_tasks.add_task(data_linking_service.link_note_to_entities, note)
     
     await note.save()
+    _invalidate_search_cache(current_user.id)
     
     return {"message": "Note updated", "id": str(note.id)}
 
 
 @router.delete("/{note_id}")
-async def delete_note(note_id: str, current_user: User = Depends(get_current_user)):
+async def delete_note(note_id: PydanticObjectId, current_user: User = Depends(get_current_user)):
     """Delete a note"""
-    note = await Note.get(PydanticPydanticObjectId(note_id))
-    if not note or note.user_id != current_user.id:
+    # Ownership is part of the filter - one server-side delete, no fetch
+    result = await Note.find_one(
+        Note.id == note_id,
+        Note.user_id == current_user.id
+    ).delete()
+    if not result or not result.deleted_count:
         raise HTTPException(status_code=404, detail="Note not found")
     
-    await note.delete()
+    _invalidate_search_cache(current_user.id)
     
     return {"message": "Note deleted"}
 
 
+async def _vector_search_notes(query_embedding: List[float], user_id: PydanticObjectId) -> List[dict]:
+    """Top notes by cosine similarity using the Atlas vector index"""
+    matches = await Note.aggregate([
+        {"$vectorSearch": {
+            "index": NOTE_VECTOR_INDEX,
+            "path": "embeddings",
+            "queryVector": query_embedding,
+            "numCandidates": 200,
+            "limit": 10,
+            "filter": {"user_id": user_id}
+        }},
+        {"$project": {
+            "title": 1,
+            # Truncate on the server so full note bodies never cross the wire
+            "content": {"$substrCP": ["$content", 0, 200]},
+            "created_at": 1,
+            "score": {"$meta": "vectorSearchScore"}
+        }}
+    ]).to_list()
+    
+    results = []
+    for match in matches:
+        # Cosine scores are reported as (1 + cosine) / 2
+        similarity = 2 * match["score"] - 1
+        if similarity > 0.5:  # Threshold
+            results.append({
+                "id": str(match["_id"]),
+                "title": match["title"],
+                "content": match["content"] + "...",
+                "similarity": similarity,
+                "created_at": match["created_at"]
+            })
+    return results
+
+
+async def _rank_notes(query_embedding: List[float], user_id: PydanticObjectId) -> List[dict]:
+    """Top notes for a query embedding - vector index first, in-process scan as fallback"""
+    try:
+        return await _vector_search_notes(query_embedding, user_id)
+    except OperationFailure:
+        # No vector search index on this deployment - score every note in-process
+        pass
+    
+    # Get all notes with embeddings
+    notes = [note for note in await Note.find(Note.user_id == user_id).to_list() if note.embeddings]
+    if not notes:
+        return []
+    
+    # Cosine similarity for every note in one matrix-vector product
+    embeddings = np.stack([note.get_embedding() for note in notes])
+    # Norms are stored at write time; only notes saved before that was added need computing
+    norms = np.array([
+        note.embedding_norm if note.embedding_norm is not None else np.linalg.norm(embeddings[i])
+        for i, note in enumerate(notes)
+    ], dtype=np.float32)
+    query_vec = np.asarray(query_embedding, dtype=np.float32)
+    similarities = embeddings @ query_vec / (norms * np.linalg.norm(query_vec) + 1e-9)
+    
+    # Top 10 without sorting every score
+    k = min(10, len(notes))
+    top = np.argpartition(-similarities, k - 1)[:k]
+    top = top[np.argsort(-similarities[top])]
+    
+    results = []
+    for index in top:
+        similarity = float(similarities[index])
+        if similarity > 0.5:  # Threshold
+            note = notes[index]
+            results.append({
+                "id": str(note.id),
+                "title": note.title,
+                "content": note.content[:200] + "...",
+                "similarity": similarity,
+                "created_at": note.created_at
+            })
+    
+    return results
+
+
+def _invalidate_search_cache(user_id: PydanticObjectId) -> None:
+    """Forget cached searches for a user whose notes changed"""
+    user_key = str(user_id)
+    for key in [key for key in _search_results if key[0] == user_key]:
+        _search_results.pop(key, None)
+    _recent_searches.pop(user_key, None)
+
+
 @router.post("/search")
 async def search_notes(query: str, current_user: User = Depends(get_current_user)):
     """Semantic search for notes"""
+    user_key = str(current_user.id)
+    
+    # Tier 1: the exact same query string - skips the embedding call too
+    exact_key = (user_key, hashlib.sha256(query.encode()).hexdigest())
+    cached = _search_results.get(exact_key)
+    if cached is not None:
+        return cached
+    
     # Generate query embedding
     query_embedding = await ai_service.generate_embeddings(query)
     
     if not query_embedding:
         raise HTTPException(status_code=400, detail="Could not generate embedding")
     
-    # Get all notes with embeddings
-    notes = await Note.find(Note.user_id == current_user.id).to_list()
-    note_embeddings = [(note.id, note.embeddings) for note in notes if note.embeddings]
+    # Tier 2: a near-identical recent query - one matrix-vector product over the recent set
+    query_vec = np.asarray(query_embedding, dtype=np.float32)
+    query_vec /= np.linalg.norm(query_vec) or 1.0
+    recent = _recent_searches.get(user_key)
+    if recent:
+        similarities = np.stack([vec for vec, _ in recent]) @ query_vec
+        best = int(np.argmax(similarities))
+        if similarities[best] > SEMANTIC_CACHE_THRESHOLD:
+            return recent[best][1]
     
-    # Find similar notes
-    similar = await ai_service.find_similar_content(query_embedding, note_embeddings)
+    results = await _rank_notes(query_embedding, current_user.id)
     
-    # Get top 10 results
-    results = []
-    for note_id, similarity in similar[:10]:
-        if similarity > 0.5:  # Threshold
-            note = await Note.get(note_id)
-            if note:
-                results.append({
-                    "id": str(note.id),
-                    "title": note.title,
-                    "content": note.content[:200] + "...",
-                    "similarity": similarity,
-                    "created_at": note.created_at
-                })
+    _search_results[exact_key] = results
+    if recent is None:
+        recent = _recent_searches[user_key] = deque(maxlen=RECENT_SEARCHES_PER_USER)
+    recent.append((query_vec, results))
     
     return results
@@ -5,11 +5,10 @@ People routes
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, EmailStr
 from beanie import PydanticObjectId
-from models.person import Person
+from models.person import Person, PersonListView
 from models.user import User
 from routes.auth import get_current_user
 from typing import List, Optional
-from beanie import PydanticObjectId
 
 router = APIRouter()
 
@@ -56,10 +55,11 @@ async def create_person(person_data: PersonCreate, current_user: User = Depends(
 @router.get("")
 async def get_people(current_user: User = Depends(get_current_user)):
     """Get all people for current user"""
-    people = await Person.find(
+    query = Person.find(
         Person.user_id == current_user.id
-    ).sort("name").to_list()
+    ).sort("name").project(PersonListView)
     
+    # Build the response straight off the cursor - no intermediate document list
     return [
         {
             "id": str(person.id),
@@ -70,56 +70,97 @@ async def get_people(current_user: User = Depends(get_current_user)):
             "tags": person.tags,
             "last_contact": person.last_contact
         }
-        for person in people
+        async for person in query
     ]
 
 
 @router.get("/{person_id}")
-async def get_person(person_id: str, current_user: User = Depends(get_current_user)):
-    """Get a specific person"""
-    person = await Person.get(PydanticPydanticObjectId(person_id))
-    if not person or person.user_id != current_user.id:
+async def get_person(person_id: PydanticObjectId, current_user: User = Depends(get_current_user)):
+    """Get a specific person with their linked notes and meetings joined in"""
+    # One round trip instead of a lookup per linked entity
+    results = await Person.aggregate([
+        {"$match": {"_id": person_id, "user_id": current_user.id}},
+        {"$lookup": {
+            "from": "notes",
+            "localField": "linked_notes",
+            "foreignField": "_id",
+            "as": "notes_full",
+            "pipeline": [{"$project": {"title": 1, "created_at": 1}}]
+        }},
+        {"$lookup": {
+            "from": "meetings",
+            "localField": "linked_meetings",
+            "foreignField": "_id",
+            "as": "meetings_full",
+            "pipeline": [{"$project": {"title": 1, "scheduled_at": 1}}]
+        }}
+    ]).to_list()
+    if not results:
         raise HTTPException(status_code=404, detail="Person not found")
+    person = results[0]
     
     return {
-        "id": str(person.id),
-        "name": person.name,
-        "email": person.email,
-        "phone": person.phone,
-        "company": person.company,
-        "role": person.role,
-        "tags": person.tags,
-        "notes": person.notes,
-        "linked_notes": [str(n) for n in person.linked_notes],
-        "linked_meetings": [str(m) for m in person.linked_meetings],
-        "last_contact": person.last_contact,
-        "created_at": person.created_at
+        "id": str(person["_id"]),
+        "name": person["name"],
+        "email": person.get("email"),
+        "phone": person.get("phone"),
+        "company": person.get("company"),
+        "role": person.get("role"),
+        "tags": person.get("tags", []),
+        "notes": person.get("notes"),
+        "linked_notes": [str(n) for n in person.get("linked_notes", [])],
+        "linked_note_details": [
+            {
+                "id": str(note["_id"]),
+                "title": note.get("title"),
+                "created_at": note.get("created_at")
+            }
+            for note in person["notes_full"]
+        ],
+        "linked_meetings": [str(m) for m in person.get("linked_meetings", [])],
+        "linked_meeting_details": [
+            {
+                "id": str(meeting["_id"]),
+                "title": meeting.get("title"),
+                "scheduled_at": meeting.get("scheduled_at")
+            }
+            for meeting in person["meetings_full"]
+        ],
+        "last_contact": person.get("last_contact"),
+        "created_at": person.get("created_at")
     }
 
 
 @router.put("/{person_id}")
-async def update_person(person_id: str, person_data: PersonUpdate, current_user: User = Depends(get_current_user)):
+async def update_person(person_id: PydanticObjectId, person_data: PersonUpdate, current_user: User = Depends(get_current_user)):
     """Update a person"""
-    person = await Person.get(PydanticPydanticObjectId(person_id))
-    if not person or person.user_id != current_user.id:
-        raise HTTPException(status_code=404, detail="Person not found")
-    
+    query = Person.find_one(
+        Person.id == person_id,
+        Person.user_id == current_user.id
+    )
     update_data = person_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(person, field, value)
     
-    await person.save()
+    # Only the changed fields are written, in one round trip
+    if update_data:
+        result = await query.update({"$set": update_data})
+        found = bool(result and result.matched_count)
+    else:
+        found = await query is not None
+    if not found:
+        raise HTTPException(status_code=404, detail="Person not found")
     
-    return {"message": "Person updated", "id": str(person.id)}
+    return {"message": "Person updated", "id": str(person_id)}
 
 
 @router.delete("/{person_id}")
-async def delete_person(person_id: str, current_user: User = Depends(get_current_user)):
+async def delete_person(person_id: PydanticObjectId, current_user: User = Depends(get_current_user)):
     """Delete a person"""
-    person = await Person.get(PydanticPydanticObjectId(person_id))
-    if not person or person.user_id != current_user.id:
+    # Ownership is part of the filter - one server-side delete, no fetch
+    result = await Person.find_one(
+        Person.id == person_id,
+        Person.user_id == current_user.id
+    ).delete()
+    if not result or not result.deleted_count:
         raise HTTPException(status_code=404, detail="Person not found")
     
-    await person.delete()
-    
     return {"message": "Person deleted"}
@@ -4,11 +4,11 @@ Reminders routes
 
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
-from models.reminder import Reminder
+from models.reminder import Reminder, ReminderListView
 from models.user import User
 from routes.auth import get_current_user
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from beanie import PydanticObjectId
 
 router = APIRouter()
@@ -19,9 +19,9 @@ class ReminderCreate(BaseModel):
     description: Optional[str] = None
     due_date: datetime
     priority: str = "medium"
-    linked_note_id: Optional[str] = None
-    linked_meeting_id: Optional[str] = None
-    linked_person_id: Optional[str] = None
+    linked_note_id: Optional[PydanticObjectId] = None
+    linked_meeting_id: Optional[PydanticObjectId] = None
+    linked_person_id: Optional[PydanticObjectId] = None
 
 
 class ReminderUpdate(BaseModel):
@@ -41,9 +41,9 @@ async def create_reminder(reminder_data: ReminderCreate, current_user: User = De
         description=reminder_data.description,
         due_date=reminder_data.due_date,
         priority=reminder_data.priority,
-        linked_note=PydanticObjectId(reminder_data.linked_note_id) if reminder_data.linked_note_id else None,
-        linked_meeting=PydanticObjectId(reminder_data.linked_meeting_id) if reminder_data.linked_meeting_id else None,
-        linked_person=PydanticObjectId(reminder_data.linked_person_id) if reminder_data.linked_person_id else None
+        linked_note=reminder_data.linked_note_id,
+        linked_meeting=reminder_data.linked_meeting_id,
+        linked_person=reminder_data.linked_person_id
     )
     await reminder.save()
     
@@ -59,15 +59,12 @@ async def create_reminder(reminder_data: ReminderCreate, current_user: User = De
 @router.get("")
 async def get_reminders(status: Optional[str] = None, current_user: User = Depends(get_current_user)):
     """Get reminders for current user"""
-    query = {"user_id": current_user.id}
-    if status:
-        query["status"] = status
-    
-    reminders = await Reminder.find(
+    query = Reminder.find(
         Reminder.user_id == current_user.id,
         Reminder.status == status if status else {}
-    ).sort("due_date").to_list()
+    ).sort("due_date").project(ReminderListView)
     
+    # Build the response straight off the cursor - no intermediate document list
     return [
         {
             "id": str(reminder.id),
@@ -78,15 +75,18 @@ async def get_reminders(status: Optional[str] = None, current_user: User = Depen
             "status": reminder.status,
             "created_at": reminder.created_at
         }
-        for reminder in reminders
+        async for reminder in query
     ]
 
 
 @router.get("/{reminder_id}")
-async def get_reminder(reminder_id: str, current_user: User = Depends(get_current_user)):
+async def get_reminder(reminder_id: PydanticObjectId, current_user: User = Depends(get_current_user)):
     """Get a specific reminder"""
-    reminder = await Reminder.get(PydanticObjectId(reminder_id))
-    if not reminder or reminder.user_id != current_user.id:
+    reminder = await Reminder.find_one(
+        Reminder.id == reminder_id,
+        Reminder.user_id == current_user.id
+    )
+    if not reminder:
         raise HTTPException(status_code=404, detail="Reminder not found")
     
     return {
@@ -105,32 +105,44 @@ async def get_reminder(reminder_id: str, current_user: User = Depends(get_curren
 
 
 @router.put("/{reminder_id}")
-async def update_reminder(reminder_id: str, reminder_data: ReminderUpdate, current_user: User = Depends(get_current_user)):
+async def update_reminder(reminder_id: PydanticObjectId, reminder_data: ReminderUpdate, current_user: User = Depends(get_current_user)):
     """Update a reminder"""
-    reminder = await Reminder.get(PydanticObjectId(reminder_id))
-    if not reminder or reminder.user_id != current_user.id:
-        raise HTTPException(status_code=404, detail="Reminder not found")
-    
+    query = Reminder.find_one(
+        Reminder.id == reminder_id,
+        Reminder.user_id == current_user.id
+    )
     update_data = reminder_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(reminder, field, value)
     
-    # Set completed_at if status is completed
-    if reminder_data.status == "completed" and not reminder.completed_at:
-        reminder.completed_at = datetime.utcnow()
-    
-    await reminder.save()
+    # Only the changed fields are written, in one round trip
+    if reminder_data.status == "completed":
+        # Pipeline update so completed_at keeps its first value; $literal stops user text being read as expressions
+        stage = {field: {"$literal": value} for field, value in update_data.items()}
+        stage["completed_at"] = {"$ifNull": ["$completed_at", datetime.now(timezone.utc)]}
+        result = await Reminder.get_pymongo_collection().update_one(
+            {"_id": reminder_id, "user_id": current_user.id},
+            [{"$set": stage}]
+        )
+        found = bool(result.matched_count)
+    elif update_data:
+        result = await query.update({"$set": update_data})
+        found = bool(result and result.matched_count)
+    else:
+        found = await query is not None
+    if not found:
+        raise HTTPException(status_code=404, detail="Reminder not found")
     
-    return {"message": "Reminder updated", "id": str(reminder.id)}
+    return {"message": "Reminder updated", "id": str(reminder_id)}
 
 
 @router.delete("/{reminder_id}")
-async def delete_reminder(reminder_id: str, current_user: User = Depends(get_current_user)):
+async def delete_reminder(reminder_id: PydanticObjectId, current_user: User = Depends(get_current_user)):
     """Delete a reminder"""
-    reminder = await Reminder.get(PydanticObjectId(reminder_id))
-    if not reminder or reminder.user_id != current_user.id:
+    # Ownership is part of the filter - one server-side delete, no fetch
+    result = await Reminder.find_one(
+        Reminder.id == reminder_id,
+        Reminder.user_id == current_user.id
+    ).delete()
+    if not result or not result.deleted_count:
         raise HTTPException(status_code=404, detail="Reminder not found")
     
-    await reminder.delete()
-    
     return {"message": "Reminder deleted"}
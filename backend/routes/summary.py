@@ -3,135 +3,202 @@ Summary routes for daily/weekly summaries
 """
 
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse, PlainTextResponse
 from models.note import Note
-from models.meeting import Meeting
-from models.reminder import Reminder
 from models.user import User
 from routes.auth import get_current_user
 from services.ai_service import ai_service
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from beanie import PydanticObjectId
+from typing import Tuple, List, AsyncIterator, NamedTuple
+import hashlib
+from cachetools import TTLCache
 
 router = APIRouter()
 
+# LLM summaries keyed by (user, period, content hash) - unchanged content never hits the model twice
+_summary_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+
+_WEEKLY_TEMPLATE = """Weekly Summary (%s to %s):
+
+Notes (%d total):
+%s
+
+Meetings (%d total):
+%s
+
+Tasks/Reminders (%d total):
+%s
+"""
+
+
+async def _fetch_activity(user_id: PydanticObjectId, start: datetime, end: datetime) -> Tuple[list, list, list]:
+    """Notes created, meetings scheduled and reminders due in [start, end) - one aggregation, split by kind"""
+    docs = await Note.aggregate([
+        {"$match": {"user_id": user_id, "created_at": {"$gte": start, "$lt": end}}},
+        {"$project": {"_kind": "note", "title": 1, "content": 1}},
+        {"$unionWith": {"coll": "meetings", "pipeline": [
+            {"$match": {"user_id": user_id, "scheduled_at": {"$gte": start, "$lt": end}}},
+            {"$project": {"_kind": "meeting", "title": 1, "scheduled_at": 1}}
+        ]}},
+        {"$unionWith": {"coll": "reminders", "pipeline": [
+            {"$match": {"user_id": user_id, "due_date": {"$gte": start, "$lt": end}}},
+            {"$project": {"_kind": "reminder", "title": 1, "priority": 1, "status": 1}}
+        ]}}
+    ]).to_list()
+    
+    by_kind = {"note": [], "meeting": [], "reminder": []}
+    for doc in docs:
+        by_kind[doc["_kind"]].append(doc)
+    return by_kind["note"], by_kind["meeting"], by_kind["reminder"]
+
+
+class _DailyActivity(NamedTuple):
+    """One day's activity and the text its summary is generated from"""
+    date: datetime
+    period: str  # summary cache period, e.g. "daily:2024-05-01"
+    notes: List[dict]
+    meetings: List[dict]
+    reminders: List[dict]
+    content: str  # empty when nothing happened that day
+
+
+async def _daily_activity(user_id: PydanticObjectId, date: str = None) -> _DailyActivity:
+    """Fetch a day's notes, meetings and reminders and build the text to summarize"""
+    target_date = datetime.fromisoformat(date) if date else datetime.now(timezone.utc)
+    start_of_day = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    end_of_day = start_of_day + timedelta(days=1)
+    
+    # Notes, meetings and reminders due that day - one round trip
+    notes, meetings, reminders = await _fetch_activity(user_id, start_of_day, end_of_day)
+    
+    # Build content for summary
+    content_parts = []
+    
+    if notes:
+        notes_text = "\n".join(f"- {note['title']}: {note['content'][:100]}" for note in notes)
+        content_parts.append(f"Notes:\n{notes_text}")
+    
+    if meetings:
+        meetings_text = "\n".join(
+            f"- {meeting['title']} at {meeting['scheduled_at']:%H:%M}"
+            for meeting in meetings
+        )
+        content_parts.append(f"Meetings:\n{meetings_text}")
+    
+    if reminders:
+        reminders_text = "\n".join(f"- {reminder['title']} ({reminder.get('priority')})" for reminder in reminders)
+        content_parts.append(f"Reminders:\n{reminders_text}")
+    
+    return _DailyActivity(
+        date=target_date,
+        period=f"daily:{start_of_day.date()}",
+        notes=notes,
+        meetings=meetings,
+        reminders=reminders,
+        content="\n\n".join(content_parts)
+    )
+
+
+def _summary_key(user_id: PydanticObjectId, period: str, content: str) -> tuple:
+    """Cache key for a summary of this exact content"""
+    return (str(user_id), period, hashlib.sha256(content.encode()).hexdigest())
+
+
+async def _cached_summary(user_id: PydanticObjectId, period: str, content: str) -> str:
+    """Generate a detailed summary, reusing the previous result for identical content"""
+    key = _summary_key(user_id, period, content)
+    summary = _summary_cache.get(key)
+    if summary is None:
+        summary = await ai_service.generate_summary(content, "detailed")
+        _summary_cache[key] = summary
+    return summary
+
 
 @router.get("/daily")
 async def get_daily_summary(date: str = None, current_user: User = Depends(get_current_user)):
     """Get daily summary for a specific date"""
     try:
-        target_date = datetime.fromisoformat(date) if date else datetime.utcnow()
-        start_of_day = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_day = start_of_day + timedelta(days=1)
-        
-        # Get notes from that day
-        notes = await Note.find(
-            Note.user_id == current_user.id,
-            Note.created_at >= start_of_day,
-            Note.created_at < end_of_day
-        ).to_list()
-        
-        # Get meetings from that day
-        meetings = await Meeting.find(
-            Meeting.user_id == current_user.id,
-            Meeting.scheduled_at >= start_of_day,
-            Meeting.scheduled_at < end_of_day
-        ).to_list()
+        activity = await _daily_activity(current_user.id, date)
         
-        # Get reminders due that day
-        reminders = await Reminder.find(
-            Reminder.user_id == current_user.id,
-            Reminder.due_date >= start_of_day,
-            Reminder.due_date < end_of_day
-        ).to_list()
-        
-        # Build content for summary
-        content_parts = []
-        
-        if notes:
-            notes_text = "\n".join([f"- {note.title}: {note.content[:100]}" for note in notes])
-            content_parts.append(f"Notes:\n{notes_text}")
-        
-        if meetings:
-            meetings_text = "\n".join([
-                f"- {meeting.title} at {meeting.scheduled_at.strftime('%H:%M')}"
-                for meeting in meetings
-            ])
-            content_parts.append(f"Meetings:\n{meetings_text}")
-        
-        if reminders:
-            reminders_text = "\n".join([f"- {reminder.title} ({reminder.priority})" for reminder in reminders])
-            content_parts.append(f"Reminders:\n{reminders_text}")
-        
-        if not content_parts:
+        if not activity.content:
             return {
-                "date": target_date.isoformat(),
+                "date": activity.date.isoformat(),
                 "summary": "No activity on this day.",
                 "notes_count": 0,
                 "meetings_count": 0,
                 "reminders_count": 0
             }
         
-        full_content = "\n\n".join(content_parts)
-        
         # Generate AI summary
-        summary = await ai_service.generate_summary(full_content, "detailed")
+        summary = await _cached_summary(current_user.id, activity.period, activity.content)
         
         return {
-            "date": target_date.isoformat(),
+            "date": activity.date.isoformat(),
             "summary": summary,
-            "notes_count": len(notes),
-            "meetings_count": len(meetings),
-            "reminders_count": len(reminders),
-            "notes": [{"id": str(n.id), "title": n.title} for n in notes[:5]],
-            "meetings": [{"id": str(m.id), "title": m.title, "time": m.scheduled_at} for m in meetings],
-            "reminders": [{"id": str(r.id), "title": r.title, "priority": r.priority} for r in reminders]
+            "notes_count": len(activity.notes),
+            "meetings_count": len(activity.meetings),
+            "reminders_count": len(activity.reminders),
+            "notes": [{"id": str(n["_id"]), "title": n["title"]} for n in activity.notes[:5]],
+            "meetings": [{"id": str(m["_id"]), "title": m["title"], "time": m["scheduled_at"]} for m in activity.meetings],
+            "reminders": [{"id": str(r["_id"]), "title": r["title"], "priority": r.get("priority")} for r in activity.reminders]
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating summary: {str(e)}")
 
 
+@router.get("/daily/stream")
+async def stream_daily_summary(date: str = None, current_user: User = Depends(get_current_user)):
+    """Daily summary text streamed as it is generated"""
+    try:
+        activity = await _daily_activity(current_user.id, date)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error generating summary: {str(e)}")
+    
+    if not activity.content:
+        return PlainTextResponse("No activity on this day.")
+    
+    key = _summary_key(current_user.id, activity.period, activity.content)
+    cached = _summary_cache.get(key)
+    if cached is not None:
+        return PlainTextResponse(cached)
+    
+    async def pieces() -> AsyncIterator[str]:
+        parts = []
+        async for piece in ai_service.generate_summary_stream(activity.content, "detailed"):
+            parts.append(piece)
+            yield piece
+        # Same cache as the non-streaming endpoint once the whole summary has arrived
+        if parts:
+            _summary_cache[key] = "".join(parts).strip()
+    
+    return StreamingResponse(pieces(), media_type="text/plain; charset=utf-8")
+
+
 @router.get("/weekly")
 async def get_weekly_summary(current_user: User = Depends(get_current_user)):
     """Get weekly summary"""
     try:
-        end_date = datetime.utcnow()
+        end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(days=7)
         
-        # Get all content from the week
-        notes = await Note.find(
-            Note.user_id == current_user.id,
-            Note.created_at >= start_date,
-            Note.created_at < end_date
-        ).to_list()
-        
-        meetings = await Meeting.find(
-            Meeting.user_id == current_user.id,
-            Meeting.scheduled_at >= start_date,
-            Meeting.scheduled_at < end_date
-        ).to_list()
-        
-        reminders = await Reminder.find(
-            Reminder.user_id == current_user.id,
-            Reminder.due_date >= start_date,
-            Reminder.due_date < end_date
-        ).to_list()
+        # Get all content from the week - one round trip
+        notes, meetings, reminders = await _fetch_activity(current_user.id, start_date, end_date)
         
         # Build content
-        content = f"""Weekly Summary ({start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}):
-
-Notes ({len(notes)} total):
-{chr(10).join([f"- {note.title}" for note in notes[:10]])}
-
-Meetings ({len(meetings)} total):
-{chr(10).join([f"- {meeting.title}" for meeting in meetings])}
-
-Tasks/Reminders ({len(reminders)} total):
-{chr(10).join([f"- {reminder.title} ({reminder.status})" for reminder in reminders[:10]])}
-"""
+        notes_text = "\n".join(f"- {note['title']}" for note in notes[:10])
+        meetings_text = "\n".join(f"- {meeting['title']}" for meeting in meetings)
+        reminders_text = "\n".join(f"- {reminder['title']} ({reminder.get('status')})" for reminder in reminders[:10])
+        content = _WEEKLY_TEMPLATE % (
+            f"{start_date:%Y-%m-%d}", f"{end_date:%Y-%m-%d}",
+            len(notes), notes_text,
+            len(meetings), meetings_text,
+            len(reminders), reminders_text
+        )
         
         # Generate AI summary
-        summary = await ai_service.generate_summary(content, "detailed")
+        summary = await _cached_summary(current_user.id, f"weekly:{end_date.date()}", content)
         
         return {
             "start_date": start_date.isoformat(),
@@ -141,7 +208,7 @@ Tasks/Reminders ({len(reminders)} total):
                 "total_notes": len(notes),
                 "total_meetings": len(meetings),
                 "total_reminders": len(reminders),
-                "completed_reminders": len([r for r in reminders if r.status == "completed"])
+                "completed_reminders": sum(1 for r in reminders if r.get("status") == "completed")
             }
         }
         
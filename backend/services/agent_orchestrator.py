@@ -4,18 +4,64 @@ Acts like multiple assistants working in parallel to analyze, connect, and provi
 All agents use the Knowledge Graph as the central data structure
 """
 
-import ollama
+from services.ollama_client import async_ollama_client
+from config.settings import settings
 import asyncio
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import defaultdict, Counter, deque
+from cachetools import TTLCache
 import json
+import re
+import hashlib
+import random
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 # Import knowledge graph
 from services.knowledge_graph import knowledge_graph
+from services.note_index import note_index, created_ts, now_ts
+from persistence import persistence
+
+# Outermost JSON object in a reply - tolerates code fences and chatter around it
+_JSON_RE = re.compile(r"\{.*\}", re.S)
+
+def _content_hash(note) -> str:
+    """Stable key for a note's text - unchanged notes map to the same cached LLM result"""
+    text = f"{note.get('title', '')}\n{note.get('content', '')}"
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+# Static system messages - built once, only the user turn varies per call
+_CLASSIFY_SYS = {
+    'role': 'system',
+    'content': '''Classify this content. Reply with ONLY this JSON object on one line, no prose, at most 3 short items per array:
+{"content_type": "idea|task|meeting_notes|reference|decision|question|reflection", "topics": ["specific topic"], "importance": 1-10, "time_sensitivity": "immediate|soon|later|timeless", "related_domains": ["domain"], "actionable": true/false, "key_concepts": ["concept"]}'''
+}
+
+_CONN_SYS = {
+    'role': 'system',
+    'content': '''Analyze if these two pieces of content are related. Return JSON:
+{
+    "connected": true/false,
+    "strength": 0.0-1.0,
+    "type": "builds_on|contradicts|supports|related_to|same_theme",
+    "reason": "brief explanation"
+}'''
+}
+
+# Pairs whose stored embeddings are less similar than this never reach the LLM
+CONNECTION_SIMILARITY_THRESHOLD = 0.55
+# Pairs sharing fewer entities than this (Jaccard), or with a near-empty note, never reach the LLM either
+CONNECTION_MIN_OVERLAP = 0.1
+CONNECTION_MIN_CONTENT_LENGTH = 40
+# A pair evaluated within this window is not considered again unless one of the notes changed
+PAIR_RECHECK_TTL = 24 * 3600
+
+# Caps concurrent agent LLM calls at what the Ollama server will actually run in parallel
+_ollama_slots = asyncio.Semaphore(settings.OLLAMA_NUM_PARALLEL)
 
 
 class AgentOrchestrator:
@@ -23,6 +69,7 @@ class AgentOrchestrator:
     
     def __init__(self):
         self.is_running = False
+        self._tasks: List[asyncio.Task] = []
         self.agents = {
             'signal_sorter': SignalSorterAgent(),
             'mind_weaver': MindWeaverAgent(),
@@ -35,11 +82,17 @@ class AgentOrchestrator:
         # Shared memory for agents
         self.shared_memory = {
             'user_context': {},
-            'recent_patterns': [],
-            'active_topics': [],
+            # Bounded - appends evict the oldest entry in O(1)
+            'recent_patterns': deque(maxlen=10),
+            'active_topics': deque(maxlen=1000),
             'entity_graph': defaultdict(list),
-            'insights_queue': [],
-            'cross_references': defaultdict(list)
+            'insights_queue': deque(maxlen=20),
+            'cross_references': defaultdict(lambda: deque(maxlen=50)),
+            # LLM results by content hash, persisted so restarts do not re-pay for them
+            'classification_cache': persistence.load('classification_cache'),
+            'connection_cache': persistence.load('connection_cache'),
+            # note id -> (content hash, float16 unit embedding) for the similarity prefilter - half the memory of float32
+            'note_vectors': {}
         }
         
     async def start(self, notes_db, people_db, reminders_db, meetings_db):
@@ -50,20 +103,24 @@ class AgentOrchestrator:
         self.reminders_db = reminders_db
         self.meetings_db = meetings_db
         
+        # Build the incremental note views once - writers keep them current from here on
+        note_index.load(notes_db)
+        
         logger.info("🧠 Starting AI Agent Orchestrator")
         
-        # Start all agents
-        tasks = []
+        # Start all agents - kept so stop() can join them
         for name, agent in self.agents.items():
             task = asyncio.create_task(
                 self._run_agent_loop(name, agent)
             )
-            tasks.append(task)
+            self._tasks.append(task)
         
         logger.info(f"✅ Started {len(self.agents)} AI agents")
         
     async def _run_agent_loop(self, name: str, agent):
         """Run individual agent in loop"""
+        # Stagger first ticks so the agents do not all hit Ollama at startup
+        await asyncio.sleep(random.uniform(0, agent.get_interval() * 0.3))
         while self.is_running:
             try:
                 # Each agent processes data at its own interval
@@ -75,9 +132,9 @@ class AgentOrchestrator:
                     shared_memory=self.shared_memory
                 )
                 
-                # Different agents run at different frequencies
+                # Different agents run at different frequencies - jittered +/-15% so ticks drift apart
                 interval = agent.get_interval()
-                await asyncio.sleep(interval)
+                await asyncio.sleep(interval * (0.85 + 0.3 * random.random()))
                 
             except Exception as e:
                 logger.error(f"Error in agent {name}: {e}")
@@ -87,6 +144,12 @@ class AgentOrchestrator:
         """Stop all agents"""
         self.is_running = False
         logger.info("🛑 Stopping AI Agent Orchestrator")
+        
+        # Agents may be mid-sleep for up to a minute - cancel rather than wait them out
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
 
 
 class SignalSorterAgent:
@@ -107,14 +170,21 @@ class SignalSorterAgent:
             if not recent_notes:
                 return
             
-            for note in recent_notes[:5]:  # Process 5 at a time
-                # Deep classification
-                loop = asyncio.get_event_loop()
-                classification = await loop.run_in_executor(
-                    None,
-                    lambda n=note: self._classify_content(n)
-                )
-                
+            batch = recent_notes[:5]  # Process 5 at a time
+            
+            # Deep classification - only notes whose content has not been seen, all in flight at once
+            cache = shared_memory['classification_cache']
+            keys = [_content_hash(note) for note in batch]
+            misses = [(key, note) for key, note in zip(keys, batch) if key not in cache]
+            if misses:
+                results = await asyncio.gather(*(self._classify_content(note) for _, note in misses))
+                for (key, _), result in zip(misses, results):
+                    if result:
+                        cache[key] = result
+                persistence.mark_dirty('classification_cache', cache)
+            
+            for note, key in zip(batch, keys):
+                classification = cache.get(key, {})
                 # Update note with classification
                 note['ai_classification'] = classification
                 note['processing_level'] = 'deep'
@@ -133,38 +203,20 @@ class SignalSorterAgent:
         except Exception as e:
             logger.error(f"Signal Sorter error: {e}")
     
-    def _classify_content(self, note):
+    async def _classify_content(self, note):
         """Classify content using Ollama"""
         try:
             content = f"{note.get('title', '')} {note.get('content', '')}"
             
-            response = ollama.chat(
-                model='llama3.2:latest',
-                messages=[{
-                    'role': 'system',
-                    'content': '''Classify this content deeply. Return JSON with:
-                    - content_type: (idea, task, meeting_notes, reference, decision, question, reflection)
-                    - topics: array of specific topics (be specific, not generic)
-                    - importance: 1-10 score
-                    - time_sensitivity: (immediate, soon, later, timeless)
-                    - related_domains: array of knowledge domains this relates to
-                    - actionable: boolean
-                    - key_concepts: array of key concepts mentioned
-                    '''
-                }, {
-                    'role': 'user',
-                    'content': content[:1000]
-                }],
-                options={'temperature': 0.2, 'num_predict': 300}
-            )
-            
-            result = response['message']['content']
-            if '```json' in result:
-                result = result.split('```json')[1].split('```')[0].strip()
-            elif '```' in result:
-                result = result.split('```')[1].split('```')[0].strip()
+            async with _ollama_slots:
+                response = await async_ollama_client.chat(
+                    model='llama3.2:latest',
+                    messages=(_CLASSIFY_SYS, {'role': 'user', 'content': content[:1000]}),
+                    # No format="json": grammar-constrained sampling is far slower than parsing the reply
+                    options={'temperature': 0.2, 'num_predict': 160, 'stop': ['\n\n\n', '```\n']}
+                )
             
-            return json.loads(result)
+            return json.loads(_JSON_RE.search(response['message']['content']).group(0))
             
         except Exception as e:
             logger.error(f"Classification error: {e}")
@@ -174,6 +226,14 @@ class SignalSorterAgent:
 class MindWeaverAgent:
     """Weaves connections between different pieces of information"""
     
+    def __init__(self):
+        # note id -> (ai_entities dict, frozen index keys) - rebuilt only when the entities dict is replaced
+        self._entity_keys_cache = {}
+        # Pairs the overlap/length guard kept away from the LLM
+        self.skipped = 0
+        # Sorted (note id, note id) -> both content hashes when the pair was last evaluated
+        self.pair_last_checked: TTLCache = TTLCache(maxsize=100_000, ttl=PAIR_RECHECK_TTL)
+    
     def get_interval(self):
         return 30  # Run every 30 seconds
     
@@ -185,36 +245,79 @@ class MindWeaverAgent:
                 return
             
             # Compare recent notes with older ones
-            recent = sorted(notes, key=lambda x: x.get('created_at', ''), reverse=True)[:10]
-            older = [n for n in notes if n not in recent][:20]
+            recent = note_index.recent(10)
+            recent_ids = {n['id'] for n in recent}
+            older = [n for n in notes if n['id'] not in recent_ids][:20]
             
             connections_found = 0
             
+            # Inverted index entity -> older notes, so only pairs sharing a person or topic are generated
+            index = defaultdict(list)
+            for old_note in older:
+                for key in self._entity_keys(old_note):
+                    index[key].append(old_note)
+            
+            # Pick the pairs worth comparing first, then ask the LLM about the uncached ones concurrently
+            pairs = []
             for recent_note in recent:
-                for old_note in older:
-                    # Check if we should compare these
-                    if self._should_compare(recent_note, old_note):
-                        connection = await self._find_connection(recent_note, old_note)
-                        
-                        if connection and connection.get('strength', 0) > 0.6:
-                            # Store in shared memory
-                            shared_memory['cross_references'][recent_note['id']].append({
-                                'target_id': old_note['id'],
-                                'connection_type': connection.get('type'),
-                                'strength': connection.get('strength'),
-                                'reason': connection.get('reason')
-                            })
-                            
-                            # Store in Knowledge Graph (THE BRAIN)
-                            knowledge_graph.link_notes(
-                                recent_note['id'],
-                                old_note['id'],
-                                connection.get('type', 'related_to'),
-                                connection.get('strength', 0.7),
-                                connection.get('reason', 'AI discovered connection')
-                            )
-                            
-                            connections_found += 1
+                seen = set()
+                for key in self._entity_keys(recent_note):
+                    for old_note in index.get(key, ()):
+                        if old_note['id'] not in seen:
+                            seen.add(old_note['id'])
+                            pairs.append((recent_note, old_note))
+            hashes = {note['id']: _content_hash(note) for note in recent + older}
+            
+            # Pairs already evaluated recently with unchanged content are settled - don't redo them every tick
+            fresh = []
+            for a, b in pairs:
+                pair_id = tuple(sorted((a['id'], b['id'])))
+                pair_hashes = tuple(hashes[note_id] for note_id in pair_id)
+                if self.pair_last_checked.get(pair_id) != pair_hashes:
+                    self.pair_last_checked[pair_id] = pair_hashes
+                    fresh.append((a, b))
+            pairs = self._prefilter_by_similarity(fresh, hashes, shared_memory['note_vectors'])
+            
+            cache = shared_memory['connection_cache']
+            # Order-independent key, so (a, b) and (b, a) share an entry
+            keys = [':'.join(sorted((hashes[a['id']], hashes[b['id']]))) for a, b in pairs]
+            misses = [(key, pair) for key, pair in zip(keys, pairs) if key not in cache]
+            asked = [(key, pair) for key, pair in misses if self._worth_asking(*pair)]
+            if len(asked) < len(misses):
+                self.skipped += len(misses) - len(asked)
+                logger.debug(f"Mind Weaver: skipped {len(misses) - len(asked)} weak pairs ({self.skipped} total)")
+            misses = asked
+            if misses:
+                results = await asyncio.gather(*(self._find_connection(*pair) for _, pair in misses))
+                for (key, (a, b)), result in zip(misses, results):
+                    if result is not None:
+                        cache[key] = result
+                    else:
+                        # Failed call - let the next tick try this pair again
+                        self.pair_last_checked.pop(tuple(sorted((a['id'], b['id']))), None)
+                persistence.mark_dirty('connection_cache', cache)
+            
+            for (recent_note, old_note), key in zip(pairs, keys):
+                connection = cache.get(key)
+                if connection and connection.get('strength', 0) > 0.6:
+                    # Store in shared memory
+                    shared_memory['cross_references'][recent_note['id']].append({
+                        'target_id': old_note['id'],
+                        'connection_type': connection.get('type'),
+                        'strength': connection.get('strength'),
+                        'reason': connection.get('reason')
+                    })
+                    
+                    # Store in Knowledge Graph (THE BRAIN)
+                    knowledge_graph.link_notes(
+                        recent_note['id'],
+                        old_note['id'],
+                        connection.get('type', 'related_to'),
+                        connection.get('strength', 0.7),
+                        connection.get('reason', 'AI discovered connection')
+                    )
+                    
+                    connections_found += 1
             
             if connections_found > 0:
                 logger.info(f"🕸️ Mind Weaver: Found {connections_found} new connections")
@@ -222,57 +325,76 @@ class MindWeaverAgent:
         except Exception as e:
             logger.error(f"Mind Weaver error: {e}")
     
-    def _should_compare(self, note1, note2):
-        """Decide if two notes should be compared"""
-        # Compare if they share topics, people, or are close in time
-        entities1 = note1.get('ai_entities', {})
-        entities2 = note2.get('ai_entities', {})
+    @staticmethod
+    def _prefilter_by_similarity(pairs, hashes, note_vectors):
+        """Drop pairs whose embeddings are dissimilar - pairs missing an embedding are kept"""
+        positions = {}
+        vectors = []
+        for note in {note['id']: note for pair in pairs for note in pair}.values():
+            cached = note_vectors.get(note['id'])
+            if cached is None or cached[0] != hashes[note['id']]:
+                embedding = note.get('embeddings')
+                if not embedding or len(embedding) != settings.EMBEDDING_DIMENSIONS:
+                    continue
+                vector = np.asarray(embedding, dtype=np.float32)
+                norm = np.linalg.norm(vector)
+                if not norm:
+                    continue
+                cached = note_vectors[note['id']] = (hashes[note['id']], (vector / norm).astype(np.float16))
+            positions[note['id']] = len(vectors)
+            vectors.append(cached[1])
         
-        # Check for shared entities
-        people1 = set(entities1.get('people', []))
-        people2 = set(entities2.get('people', []))
+        scored = [
+            (i, positions[a['id']], positions[b['id']])
+            for i, (a, b) in enumerate(pairs)
+            if a['id'] in positions and b['id'] in positions
+        ]
+        if not scored:
+            return pairs
         
-        topics1 = set(entities1.get('topics', []))
-        topics2 = set(entities2.get('topics', []))
+        # Cosine similarity of every scored pair in one vectorized pass - stored half precision, computed in float32
+        matrix = np.stack(vectors).astype(np.float32)
+        index, left, right = (np.array(column) for column in zip(*scored))
+        similarities = np.einsum('ij,ij->i', matrix[left], matrix[right])
+        dropped = set(index[similarities < CONNECTION_SIMILARITY_THRESHOLD].tolist())
+        return [pair for i, pair in enumerate(pairs) if i not in dropped]
+    
+    def _entity_keys(self, note):
+        """People and topics of a note as index keys - notes are compared only if they share one"""
+        entities = note.get('ai_entities', {})
+        cached = self._entity_keys_cache.get(note['id'])
+        if cached is not None and cached[0] is entities:
+            return cached[1]
         
-        return bool(people1 & people2) or bool(topics1 & topics2)
+        # Kept off the note itself - notes are persisted and served as JSON
+        keys = frozenset(
+            [('p', person) for person in entities.get('people', [])] +
+            [('t', topic) for topic in entities.get('topics', [])]
+        )
+        self._entity_keys_cache[note['id']] = (entities, keys)
+        return keys
+    
+    def _worth_asking(self, note1, note2):
+        """Cheap guard before the LLM - enough shared entities and enough text on both sides"""
+        if min(len(note1.get('content', '').strip()), len(note2.get('content', '').strip())) < CONNECTION_MIN_CONTENT_LENGTH:
+            return False
+        keys1, keys2 = self._entity_keys(note1), self._entity_keys(note2)
+        return len(keys1 & keys2) / max(1, len(keys1 | keys2)) >= CONNECTION_MIN_OVERLAP
     
     async def _find_connection(self, note1, note2):
         """Find connection between two notes using AI"""
         try:
-            loop = asyncio.get_event_loop()
-            
             content1 = f"{note1.get('title', '')} {note1.get('content', '')}"[:500]
             content2 = f"{note2.get('title', '')} {note2.get('content', '')}"[:500]
             
-            result = await loop.run_in_executor(
-                None,
-                lambda: ollama.chat(
+            async with _ollama_slots:
+                result = await async_ollama_client.chat(
                     model='llama3.2:latest',
-                    messages=[{
-                        'role': 'system',
-                        'content': '''Analyze if these two pieces of content are related. Return JSON:
-                        {
-                            "connected": true/false,
-                            "strength": 0.0-1.0,
-                            "type": "builds_on|contradicts|supports|related_to|same_theme",
-                            "reason": "brief explanation"
-                        }'''
-                    }, {
-                        'role': 'user',
-                        'content': f"Content 1: {content1}\n\nContent 2: {content2}"
-                    }],
-                    options={'temperature': 0.3, 'num_predict': 150}
+                    messages=(_CONN_SYS, {'role': 'user', 'content': f"Content 1: {content1}\n\nContent 2: {content2}"}),
+                    options={'temperature': 0.3, 'num_predict': 80, 'stop': ['\n\n\n', '```\n']}
                 )
-            )
-            
-            response = result['message']['content']
-            if '```json' in response:
-                response = response.split('```json')[1].split('```')[0].strip()
-            elif '```' in response:
-                response = response.split('```')[1].split('```')[0].strip()
             
-            return json.loads(response)
+            return json.loads(_JSON_RE.search(result['message']['content']).group(0))
             
         except Exception as e:
             logger.debug(f"Connection analysis error: {e}")
@@ -289,31 +411,26 @@ class ContextBuilderAgent:
         """Build current context"""
         try:
             # Analyze what user is currently focused on
-            recent_notes = sorted(
-                notes_db.values(),
-                key=lambda x: x.get('created_at', ''),
-                reverse=True
-            )[:5]
+            recent_notes = note_index.recent(5)
             
             if not recent_notes:
                 return
             
             # Extract current focus areas
-            focus_areas = defaultdict(int)
-            active_people = defaultdict(int)
+            focus_areas = Counter()
+            active_people = Counter()
             
             for note in recent_notes:
                 entities = note.get('ai_entities', {})
-                for topic in entities.get('topics', []):
-                    focus_areas[topic] += 1
-                for person in entities.get('people', []):
-                    active_people[person] += 1
+                focus_areas.update(entities.get('topics', []))
+                active_people.update(entities.get('people', []))
             
             # Build context summary
+            active_topics = [topic for topic, _ in focus_areas.most_common(5)]
             context = {
-                'primary_focus': max(focus_areas.items(), key=lambda x: x[1])[0] if focus_areas else None,
-                'active_topics': [k for k, v in sorted(focus_areas.items(), key=lambda x: x[1], reverse=True)[:5]],
-                'active_people': [k for k, v in sorted(active_people.items(), key=lambda x: x[1], reverse=True)[:5]],
+                'primary_focus': active_topics[0] if active_topics else None,
+                'active_topics': active_topics,
+                'active_people': [person for person, _ in active_people.most_common(5)],
                 'recent_activity_level': len(recent_notes),
                 'updated_at': datetime.now().isoformat()
             }
@@ -329,6 +446,15 @@ class ContextBuilderAgent:
 class PatternDetectorAgent:
     """Detects patterns and trends over time"""
     
+    _DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+    
+    def __init__(self):
+        # Parsed created_at values as datetime64[s], rebuilt only when the set or order of notes changes
+        self._created_key = None
+        self._created = np.empty(0, dtype='datetime64[s]')
+        # Position in the notes list of each parsed timestamp
+        self._created_index = np.empty(0, dtype=np.int64)
+    
     def get_interval(self):
         return 60  # Run every minute
     
@@ -355,65 +481,91 @@ class PatternDetectorAgent:
                 'detected_at': datetime.now().isoformat()
             }
             
+            # Keeps only the last 10 pattern detections
             shared_memory['recent_patterns'].append(patterns)
             
-            # Keep only last 10 pattern detections
-            if len(shared_memory['recent_patterns']) > 10:
-                shared_memory['recent_patterns'] = shared_memory['recent_patterns'][-10:]
-            
             logger.info(f"📈 Pattern Detector: Found {len(time_patterns)} temporal patterns")
             
         except Exception as e:
             logger.error(f"Pattern Detector error: {e}")
     
+    def _created_timestamps(self, notes):
+        """created_at of every parseable note as datetime64[s] (wall-clock time, offset dropped)"""
+        # Keyed on ids rather than the count alone - a delete plus an add would shift positions
+        key = tuple(note.get('id') for note in notes)
+        if key != self._created_key:
+            stamps = []
+            index = []
+            for position, note in enumerate(notes):
+                ts = created_ts(note)
+                if ts is not None:
+                    stamps.append(ts)
+                    index.append(position)
+            self._created = np.array(stamps, dtype=np.int64).astype('datetime64[s]')
+            self._created_index = np.array(index, dtype=np.int64)
+            self._created_key = key
+        return self._created
+    
+    @staticmethod
+    def _top_counts(counts, labels, k=3):
+        """Top-k non-zero bins as (label, count), highest first"""
+        k = min(k, len(counts))
+        top = np.argpartition(-counts, k - 1)[:k]
+        top = top[np.argsort(-counts[top], kind='stable')]
+        return [(labels[i], int(counts[i])) for i in top if counts[i]]
+    
     def _detect_time_patterns(self, notes):
         """Detect when user is most active"""
-        hour_counts = defaultdict(int)
-        day_counts = defaultdict(int)
+        created = self._created_timestamps(notes)
         
-        for note in notes:
-            try:
-                created = datetime.fromisoformat(note.get('created_at', ''))
-                hour_counts[created.hour] += 1
-                day_counts[created.strftime('%A')] += 1
-            except:
-                pass
+        # Hour of day and weekday straight from the epoch offsets - 1970-01-01 was a Thursday
+        hours = created.astype('datetime64[h]').astype(np.int64) % 24
+        weekdays = (created.astype('datetime64[D]').astype(np.int64) + 3) % 7
         
         return {
-            'peak_hours': sorted(hour_counts.items(), key=lambda x: x[1], reverse=True)[:3],
-            'active_days': sorted(day_counts.items(), key=lambda x: x[1], reverse=True)[:3]
+            'peak_hours': self._top_counts(np.bincount(hours, minlength=24), range(24)),
+            'active_days': self._top_counts(np.bincount(weekdays, minlength=7), self._DAY_NAMES)
         }
     
     def _detect_topic_evolution(self, notes):
         """Detect how topics are evolving"""
-        # Group notes by week
-        now = datetime.now()
-        weeks = defaultdict(lambda: defaultdict(int))
+        # Group notes by week - bucket every timestamp in one vectorized pass
+        created = self._created_timestamps(notes)
+        now = np.datetime64(now_ts(), 's')
+        weeks_ago = (now - created).astype(np.int64) // (86400 * 7)
+        in_range = np.flatnonzero((weeks_ago >= 0) & (weeks_ago <= 4))  # Last 4 weeks
         
-        for note in notes:
-            try:
-                created = datetime.fromisoformat(note.get('created_at', ''))
-                weeks_ago = (now - created).days // 7
-                
-                if weeks_ago <= 4:  # Last 4 weeks
-                    entities = note.get('ai_entities', {})
-                    for topic in entities.get('topics', []):
-                        weeks[weeks_ago][topic] += 1
-            except:
-                pass
+        # Flatten to (week, topic id) codes and count them with a single bincount
+        vocab = {}
+        note_weeks = []
+        topic_ids = []
+        for position, week in zip(self._created_index[in_range].tolist(), weeks_ago[in_range].tolist()):
+            for topic in notes[position].get('ai_entities', {}).get('topics', []):
+                note_weeks.append(week)
+                topic_ids.append(vocab.setdefault(topic, len(vocab)))
+        if not topic_ids:
+            return {}
+        
+        note_weeks = np.array(note_weeks, dtype=np.int64)
+        first_week = int(note_weeks.min())
+        span = int(note_weeks.max()) - first_week + 1
+        counts = np.bincount(
+            (note_weeks - first_week) * len(vocab) + np.array(topic_ids, dtype=np.int64),
+            minlength=span * len(vocab)
+        ).reshape(span, len(vocab))
         
-        return dict(weeks)
+        topics = list(vocab)
+        weeks = {}
+        for row, week_counts in enumerate(counts):
+            present = np.flatnonzero(week_counts)
+            if present.size:
+                weeks[first_week + row] = {topics[i]: int(week_counts[i]) for i in present}
+        return weeks
     
     def _detect_collaboration_patterns(self, notes, people_db):
         """Detect who user works with most"""
-        person_mentions = defaultdict(int)
-        
-        for note in notes:
-            entities = note.get('ai_entities', {})
-            for person in entities.get('people', []):
-                person_mentions[person] += 1
-        
-        return sorted(person_mentions.items(), key=lambda x: x[1], reverse=True)[:10]
+        # Mention counts are maintained on write by the note index
+        return note_index.person_mentions.most_common(10)
 
 
 class InsightGeneratorAgent:
@@ -467,12 +619,9 @@ class InsightGeneratorAgent:
             # Add insights to queue
             for insight in insights:
                 insight['generated_at'] = datetime.now().isoformat()
+                # Queue keeps only the last 20 insights
                 shared_memory['insights_queue'].append(insight)
             
-            # Keep only last 20 insights
-            if len(shared_memory['insights_queue']) > 20:
-                shared_memory['insights_queue'] = shared_memory['insights_queue'][-20:]
-            
             if insights:
                 logger.info(f"💡 Insight Generator: Generated {len(insights)} new insights")
             
@@ -481,17 +630,14 @@ class InsightGeneratorAgent:
     
     def _find_unfinished_items(self, notes_db, reminders_db):
         """Find unfinished items"""
-        pending = [r for r in reminders_db.values() if r.get('status') == 'pending']
-        
-        # Find old pending items
+        # Find items pending for more than 3 whole days
+        cutoff = now_ts() - 4 * 86400
         old_pending = []
-        for reminder in pending:
-            try:
-                created = datetime.fromisoformat(reminder.get('created_at', ''))
-                if (datetime.now() - created).days > 3:
+        for reminder in reminders_db.values():
+            if reminder.get('status') == 'pending':
+                created = created_ts(reminder)
+                if created is not None and created <= cutoff:
                     old_pending.append(reminder.get('title'))
-            except:
-                pass
         
         if old_pending:
             return f"{len(old_pending)} tasks pending for over 3 days"
@@ -499,31 +645,12 @@ class InsightGeneratorAgent:
     
     def _find_neglected_people(self, notes_db, people_db):
         """Find people not mentioned recently"""
-        # Find people mentioned more than 7 days ago
-        now = datetime.now()
-        people_last_seen = {}
-        
-        for note in notes_db.values():
-            try:
-                created = datetime.fromisoformat(note.get('created_at', ''))
-                entities = note.get('ai_entities', {})
-                
-                for person in entities.get('people', []):
-                    if person not in people_last_seen or created > datetime.fromisoformat(people_last_seen[person]):
-                        people_last_seen[person] = created.isoformat()
-            except:
-                pass
-        
-        neglected = []
-        for person, last_seen in people_last_seen.items():
-            try:
-                last_seen_dt = datetime.fromisoformat(last_seen)
-                if (now - last_seen_dt).days > 14:
-                    neglected.append(person)
-            except:
-                pass
-        
-        return neglected
+        # Find people not mentioned for more than 14 whole days - last mentions are maintained on write
+        cutoff = now_ts() - 15 * 86400
+        return [
+            person for person, (last_seen, _) in note_index.person_last_seen.items()
+            if last_seen <= cutoff
+        ]
 
 
 class RelationshipMapperAgent:
@@ -3,38 +3,190 @@ AI Service for Ollama integration
 Handles embeddings, entity extraction, summarization, and relationship analysis
 """
 
-import ollama
+from services.ollama_client import async_ollama_client
 from config.settings import settings
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, AsyncIterator
+from collections import deque
+from cachetools import TTLCache
+import hashlib
+import json
 import logging
+import orjson
 import asyncio
+import re
+import numpy as np
+
+try:
+    # Optional - SIMD cosine kernels; find_similar_content falls back to numpy without it
+    import simsimd
+except ImportError:
+    simsimd = None
 
 logger = logging.getLogger(__name__)
 
-# Ollama client will use default local instance
+# All calls go through the shared AsyncClient - concurrent requests overlap instead of queueing on the thread pool
+
+# Response caches - exact prompt, then near-duplicate inputs of the same kind of request
+RESPONSE_CACHE_TTL = 3600
+SEMANTIC_CACHE_THRESHOLD = 0.95
+RECENT_PROMPTS_PER_KIND = 256
+# Only classifications, where a near-duplicate input's answer is still right - never summaries or extractions
+SEMANTIC_CACHE_KINDS = frozenset({"relationship", "sentiment", "priority"})
+_exact_responses: TTLCache = TTLCache(maxsize=4096, ttl=RESPONSE_CACHE_TTL)
+_recent_prompts: TTLCache = TTLCache(maxsize=64, ttl=RESPONSE_CACHE_TTL)
+
+# Capitalized terms (names, acronyms) and numbers must match exactly for a near-duplicate hit -
+# "CPC" and "CPM", or "due in 2 days" and "due in 20 days", embed almost alike
+_KEY_TERM_RE = re.compile(r"\b[A-Z][\w-]*|\d[\d.,:/-]*")
+
+# Shared by generate_summary and its streaming variant
+_SUMMARY_PROMPTS = {
+    "brief": "Provide a brief 2-3 sentence summary of the following content:",
+    "detailed": "Provide a detailed summary with key points of the following content:",
+    "bullet": "Provide a bullet-point summary of the key points from the following content:"
+}
+_SUMMARY_SYSTEM = "You are a helpful summarization assistant."
+
+# Body of the first markdown code fence in a reply, with or without a json tag
+_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)```", re.DOTALL)
+
+
+def _extract_json(content: str) -> str:
+    """JSON text of an LLM reply - the fenced block if there is one, else the whole reply"""
+    match = _FENCE_RE.search(content)
+    return (match.group(1) if match else content).strip()
+
+
+def _complete_json(content: str) -> Optional[str]:
+    """JSON text of a partial streamed reply once it holds a complete object or array, else None"""
+    text = _extract_json(content)
+    if "```" in text:
+        # Opening fence streamed but not the closing one yet
+        text = text.split("```", 1)[1].removeprefix("json").strip()
+    try:
+        parsed = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return None
+    return text if isinstance(parsed, (dict, list)) else None
 
 
 class AIService:
     """AI service for various AI operations"""
     
+    @staticmethod
+    def _normalize(vector) -> np.ndarray:
+        """Unit-length float32 copy of a vector (zero vectors stay zero)"""
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    
     @staticmethod
     async def generate_embeddings(text: str) -> List[float]:
-        """Generate embeddings for semantic search using Ollama"""
+        """Generate a unit-length embedding for semantic search using Ollama"""
         try:
-            # Run Ollama in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: ollama.embeddings(
-                    model=settings.OLLAMA_EMBEDDING_MODEL,
-                    prompt=text
-                )
+            response = await async_ollama_client.embeddings(
+                model=settings.OLLAMA_EMBEDDING_MODEL,
+                prompt=text
             )
-            return response['embedding']
+            # Normalized once here, so cosine similarity downstream is a plain dot product
+            return AIService._normalize(response['embedding']).tolist()
         except Exception as e:
             logger.error(f"Error generating embeddings: {e}")
             return []
     
+    @staticmethod
+    async def generate_embeddings_batch(texts: List[str]) -> List[List[float]]:
+        """Generate unit-length embeddings for many texts with one /api/embed call per batch"""
+        embeddings = []
+        batch_size = max(1, settings.OLLAMA_EMBED_BATCH_SIZE)
+        
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start:start + batch_size]
+            try:
+                response = await async_ollama_client.embed(
+                    model=settings.OLLAMA_EMBEDDING_MODEL,
+                    input=batch
+                )
+                batch_embeddings = response.get('embeddings')
+            except Exception as e:
+                logger.error(f"Error generating batch embeddings: {e}")
+                batch_embeddings = None
+            
+            if not batch_embeddings or len(batch_embeddings) != len(batch):
+                # Older Ollama servers lack /api/embed - fall back to one call per text
+                batch_embeddings = await asyncio.gather(
+                    *[AIService.generate_embeddings(text) for text in batch]
+                )
+            embeddings.extend(AIService._normalize(embedding).tolist() for embedding in batch_embeddings)
+        
+        return embeddings
+    
+    @staticmethod
+    async def _chat(kind: str, system: str, prompt: str, subject: str, options: Dict[str, Any],
+                    json_reply: bool = True, cache: bool = True) -> str:
+        """
+        Chat completion text for a prompt, served from the response caches when possible
+        subject is the variable input the prompt was built from - near-duplicates are judged on it, not the template
+        json_reply replies are streamed and cut off as soon as they hold a complete JSON value
+        cache=False skips both caches, for callers that cache the result themselves
+        """
+        namespace = hashlib.sha256(f"{settings.OLLAMA_MODEL}|{kind}|{system}|{sorted(options.items())}".encode()).hexdigest()
+        
+        # Tier 1: the exact same prompt
+        exact_key = hashlib.sha256(f"{namespace}|{prompt}".encode()).hexdigest()
+        cached = _exact_responses.get(exact_key) if cache else None
+        if cached is not None:
+            return cached
+        
+        # Tier 2: a near-identical recent subject with the same names, acronyms and numbers
+        key_terms = frozenset(_KEY_TERM_RE.findall(subject))
+        subject_vec = None
+        embedding = await AIService.generate_embeddings(subject) if cache and kind in SEMANTIC_CACHE_KINDS else None
+        if embedding:
+            # Kept as float16 in the cache - plenty of precision for a 0.95 threshold at half the memory
+            subject_vec = np.asarray(embedding, dtype=np.float16)
+            recent = _recent_prompts.get(namespace)
+            if recent:
+                similarities = np.stack([vec for vec, _, _ in recent]).astype(np.float32) @ subject_vec.astype(np.float32)
+                best = int(np.argmax(similarities))
+                if similarities[best] > SEMANTIC_CACHE_THRESHOLD and recent[best][1] == key_terms:
+                    return recent[best][2]
+        
+        stream = await async_ollama_client.chat(
+            model=settings.OLLAMA_MODEL,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": prompt}
+            ],
+            options=options,
+            stream=True
+        )
+        parts = []
+        try:
+            async for chunk in stream:
+                piece = chunk['message']['content']
+                parts.append(piece)
+                # Stop at the closing bracket instead of waiting out trailing fences and chatter
+                if json_reply and ('}' in piece or ']' in piece):
+                    complete = _complete_json(''.join(parts))
+                    if complete is not None:
+                        parts = [complete]
+                        break
+        finally:
+            # Closing the stream drops the connection, which stops generation on the Ollama server
+            await stream.aclose()
+        content = ''.join(parts)
+        
+        if cache:
+            _exact_responses[exact_key] = content
+        if subject_vec is not None:
+            recent = _recent_prompts.get(namespace)
+            if recent is None:
+                recent = _recent_prompts[namespace] = deque(maxlen=RECENT_PROMPTS_PER_KIND)
+            recent.append((subject_vec, key_terms, content))
+        
+        return content
+    
     @staticmethod
     async def extract_entities(text: str) -> Dict[str, Any]:
         """Extract entities (people, dates, topics) from text"""
@@ -52,34 +204,19 @@ Please identify:
 
 Return as JSON with keys: people, dates, topics, organizations, locations"""
 
-            # Run Ollama in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: ollama.chat(
-                    model=settings.OLLAMA_MODEL,
-                    messages=[
-                        {"role": "system", "content": "You are an entity extraction assistant. Extract entities and return valid JSON."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    options={"temperature": 0.3}
-                )
+            content = await AIService._chat(
+                "entities",
+                "You are an entity extraction assistant. Extract entities and return valid JSON.",
+                prompt,
+                subject=text,
+                options={"temperature": 0.3}
             )
             
-            import json
-            content = response.choices[0].message.content
-            
             # Try to parse JSON from the response
             try:
-                # Remove markdown code blocks if present
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
-                
-                entities = json.loads(content)
+                entities = orjson.loads(_extract_json(content))
                 return entities
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 # If JSON parsing fails, return empty structure
                 logger.warning("Could not parse JSON from entity extraction response")
                 return {
@@ -104,34 +241,47 @@ Return as JSON with keys: people, dates, topics, organizations, locations"""
     async def generate_summary(content: str, summary_type: str = "brief") -> str:
         """Generate summary of content"""
         try:
-            prompts = {
-                "brief": "Provide a brief 2-3 sentence summary of the following content:",
-                "detailed": "Provide a detailed summary with key points of the following content:",
-                "bullet": "Provide a bullet-point summary of the key points from the following content:"
-            }
+            prompt = _SUMMARY_PROMPTS.get(summary_type, _SUMMARY_PROMPTS["brief"])
             
-            prompt = prompts.get(summary_type, prompts["brief"])
-            
-            # Run Ollama in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: ollama.chat(
-                    model=settings.OLLAMA_MODEL,
-                    messages=[
-                        {"role": "system", "content": "You are a helpful summarization assistant."},
-                        {"role": "user", "content": f"{prompt}\n\n{content}"}
-                    ],
-                    options={"temperature": 0.5, "num_predict": 500}
-                )
+            summary = await AIService._chat(
+                f"summary:{summary_type}",
+                _SUMMARY_SYSTEM,
+                f"{prompt}\n\n{content}",
+                subject=content,
+                options={"temperature": 0.5, "num_predict": 500},
+                json_reply=False,
+                # routes/summary.py caches summaries per user and period
+                cache=False
             )
             
-            return response['message']['content'].strip()
+            return summary.strip()
             
         except Exception as e:
             logger.error(f"Error generating summary: {e}")
             return "Error generating summary"
     
+    @staticmethod
+    async def generate_summary_stream(content: str, summary_type: str = "brief") -> AsyncIterator[str]:
+        """Yield a summary piece by piece as it is generated - bypasses the response caches"""
+        prompt = _SUMMARY_PROMPTS.get(summary_type, _SUMMARY_PROMPTS["brief"])
+        try:
+            stream = await async_ollama_client.chat(
+                model=settings.OLLAMA_MODEL,
+                messages=[
+                    {"role": "system", "content": _SUMMARY_SYSTEM},
+                    {"role": "user", "content": f"{prompt}\n\n{content}"}
+                ],
+                options={"temperature": 0.5, "num_predict": 500},
+                stream=True
+            )
+            try:
+                async for chunk in stream:
+                    yield chunk['message']['content']
+            finally:
+                await stream.aclose()
+        except Exception as e:
+            logger.error(f"Error streaming summary: {e}")
+    
     @staticmethod
     async def analyze_relationship(source_content: str, target_content: str) -> Dict[str, Any]:
         """Analyze relationship between two pieces of content"""
@@ -150,33 +300,19 @@ Determine:
 
 Return as JSON with keys: relationship_type, strength, reasoning, shared_themes"""
 
-            # Run Ollama in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: ollama.chat(
-                    model=settings.OLLAMA_MODEL,
-                    messages=[
-                        {"role": "system", "content": "You are a relationship analysis assistant. Analyze relationships and return valid JSON."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    options={"temperature": 0.3}
-                )
+            content = await AIService._chat(
+                "relationship",
+                "You are a relationship analysis assistant. Analyze relationships and return valid JSON.",
+                prompt,
+                subject=f"{source_content[:500]}\n{target_content[:500]}",
+                options={"temperature": 0.3}
             )
             
-            import json
-            content = response['message']['content']
-            
             # Try to parse JSON
             try:
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
-                
-                analysis = json.loads(content)
+                analysis = orjson.loads(_extract_json(content))
                 return analysis
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.warning("Could not parse JSON from relationship analysis")
                 return {
                     "relationship_type": "related_to",
@@ -196,33 +332,36 @@ Return as JSON with keys: relationship_type, strength, reasoning, shared_themes"
     
     @staticmethod
     async def find_similar_content(query_embedding: List[float], 
-                                   candidate_embeddings: List[tuple]) -> List[tuple]:
-        """Find similar content using cosine similarity"""
-        import numpy as np
-        
+                                   candidate_embeddings: List[tuple], k: int = 20) -> List[tuple]:
+        """Top-k similar content by cosine similarity - candidates are expected to be unit-length"""
         if not query_embedding or not candidate_embeddings:
             return []
         
-        query_vec = np.array(query_embedding)
-        
-        similarities = []
+        ids, vectors = [], []
         for item_id, embedding in candidate_embeddings:
-            if not embedding:
+            if embedding is None or len(embedding) == 0:
                 continue
-            
-            candidate_vec = np.array(embedding)
-            
-            # Cosine similarity
-            similarity = np.dot(query_vec, candidate_vec) / (
-                np.linalg.norm(query_vec) * np.linalg.norm(candidate_vec)
-            )
-            
-            similarities.append((item_id, float(similarity)))
+            ids.append(item_id)
+            vectors.append(embedding)
+        if not vectors:
+            return []
         
-        # Sort by similarity (highest first)
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        # One (N, D) matrix against the query instead of a Python loop of per-candidate numpy calls
+        matrix = np.asarray(vectors, dtype=np.float32)
+        query_vec = AIService._normalize(query_embedding)
+        if simsimd is not None:
+            similarities = 1.0 - np.asarray(simsimd.cdist(query_vec[None, :], matrix, metric="cosine"))[0]
+        else:
+            # Unit vectors - cosine similarity is a single matrix-vector product
+            similarities = matrix @ query_vec
         
-        return similarities
+        # Top k without sorting every score, then only those k by similarity (highest first)
+        k = min(k, similarities.size)
+        if k <= 0:
+            return []
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
+        return list(zip([ids[i] for i in top], similarities[top].tolist()))
     
     @staticmethod
     async def detect_sentiment(text: str) -> Dict[str, Any]:
@@ -243,28 +382,15 @@ Determine:
 
 Return as JSON: {{"sentiment": "positive", "confidence": 0.85, "emotions": ["excited", "hopeful"], "urgency": "medium"}}"""
 
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: ollama.chat(
-                    model=settings.OLLAMA_MODEL,
-                    messages=[
-                        {"role": "system", "content": "You are a sentiment analysis expert."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    options={"temperature": 0.3}
-                )
+            content = await AIService._chat(
+                "sentiment",
+                "You are a sentiment analysis expert.",
+                prompt,
+                subject=text,
+                options={"temperature": 0.3}
             )
             
-            import json
-            content = response['message']['content']
-            
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-            
-            sentiment = json.loads(content)
+            sentiment = orjson.loads(_extract_json(content))
             return sentiment
             
         except Exception as e:
@@ -310,28 +436,15 @@ Return as JSON: {{
     "reasoning": "Contains specific deadline and actionable task"
 }}"""
 
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: ollama.chat(
-                    model=settings.OLLAMA_MODEL,
-                    messages=[
-                        {"role": "system", "content": "You are a priority and urgency detection expert."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    options={"temperature": 0.3}
-                )
+            content = await AIService._chat(
+                "priority",
+                "You are a priority and urgency detection expert.",
+                prompt,
+                subject=f"{text}{context_str}",
+                options={"temperature": 0.3}
             )
             
-            import json
-            content = response['message']['content']
-            
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-            
-            priority_info = json.loads(content)
+            priority_info = orjson.loads(_extract_json(content))
             return priority_info
             
         except Exception as e:
@@ -373,28 +486,15 @@ Return as JSON array: [{{
 
 If no tasks found, return empty array: []"""
 
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: ollama.chat(
-                    model=settings.OLLAMA_MODEL,
-                    messages=[
-                        {"role": "system", "content": "You are a task extraction expert."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    options={"temperature": 0.3}
-                )
+            content = await AIService._chat(
+                "tasks",
+                "You are a task extraction expert.",
+                prompt,
+                subject=text,
+                options={"temperature": 0.3}
             )
             
-            import json
-            content = response['message']['content']
-            
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-            
-            tasks = json.loads(content)
+            tasks = orjson.loads(_extract_json(content))
             return tasks if isinstance(tasks, list) else []
             
         except Exception as e:
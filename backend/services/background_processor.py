@@ -3,10 +3,13 @@ Background AI Processor - Automatically processes user messages and organizes da
 Uses Ollama for local AI inference
 """
 
-import ollama
+from services.ollama_client import ollama_client
+from services.entity_resolver import entity_resolver
+from services.note_index import note_index
 import asyncio
 import logging
 from typing import Dict, Any, List
+from functools import partial
 from datetime import datetime
 import json
 
@@ -89,7 +92,8 @@ class BackgroundProcessor:
             # Extract entities and topics
             response = await loop.run_in_executor(
                 None,
-                lambda: ollama.chat(
+                partial(
+                    ollama_client.chat,
                     model='llama3.2:latest',
                     messages=[{
                         'role': 'system',
@@ -110,14 +114,16 @@ class BackgroundProcessor:
                 ai_content = ai_content.split("```")[1].split("```")[0].strip()
             
             try:
-                entities = json.loads(ai_content)
+                # Store canonical names so "Dr. Smith" and "John Smith" count as one person downstream
+                entities = entity_resolver.canonicalize_entities(json.loads(ai_content))
             except:
                 entities = {"people": [], "dates": [], "topics": [], "tasks": [], "organizations": [], "locations": []}
             
             # Generate embeddings for similarity search
             embeddings = await loop.run_in_executor(
                 None,
-                lambda: ollama.embeddings(
+                partial(
+                    ollama_client.embeddings,
                     model='embeddinggemma:latest',
                     prompt=content
                 )
@@ -126,7 +132,8 @@ class BackgroundProcessor:
             # Detect sentiment and priority
             sentiment_response = await loop.run_in_executor(
                 None,
-                lambda: ollama.chat(
+                partial(
+                    ollama_client.chat,
                     model='llama3.2:latest',
                     messages=[{
                         'role': 'system',
@@ -158,6 +165,7 @@ class BackgroundProcessor:
                 notes_db[note['id']]['sentiment'] = sentiment_data
                 notes_db[note['id']]['ai_processed'] = True
                 notes_db[note['id']]['processed_at'] = datetime.now().isoformat()
+                note_index.update(notes_db[note['id']])
                 
                 # Auto-create people entries
                 if people_db is not None:
@@ -278,7 +286,8 @@ class BackgroundProcessor:
             # Infer what the user wants to do
             response = await loop.run_in_executor(
                 None,
-                lambda: ollama.chat(
+                partial(
+                    ollama_client.chat,
                     model='llama3.2:latest',
                     messages=[{
                         'role': 'system',
@@ -3,9 +3,10 @@ Creative Muse - Proactive AI Agent
 Surfaces relevant old ideas, discovers patterns, and provides contextual inspiration
 """
 
-import ollama
+from services.ollama_client import ollama_client
 from config.settings import settings
 from typing import List, Dict, Any, Optional
+from functools import partial
 import logging
 import asyncio
 from datetime import datetime, timedelta
@@ -63,7 +64,8 @@ Only include notes with relevance_score > 0.6
             loop = asyncio.get_event_loop()
             response = await loop.run_in_executor(
                 None,
-                lambda: ollama.chat(
+                partial(
+                    ollama_client.chat,
                     model=settings.OLLAMA_MODEL,
                     messages=[
                         {"role": "system", "content": "You are a creative muse that helps users discover connections between their past and present thoughts."},
@@ -148,7 +150,8 @@ Return as JSON:
             loop = asyncio.get_event_loop()
             response = await loop.run_in_executor(
                 None,
-                lambda: ollama.chat(
+                partial(
+                    ollama_client.chat,
                     model=settings.OLLAMA_MODEL,
                     messages=[
                         {"role": "system", "content": "You are a proactive AI assistant that identifies patterns and opportunities in user data."},
@@ -224,11 +227,12 @@ What are the 3-5 main themes or topics? Return as JSON: {{"themes": ["theme1", "
                 loop = asyncio.get_event_loop()
                 response = await loop.run_in_executor(
                     None,
-                    lambda p=prompt: ollama.chat(
+                    partial(
+                        ollama_client.chat,
                         model=settings.OLLAMA_MODEL,
                         messages=[
                             {"role": "system", "content": "You are a theme detection assistant."},
-                            {"role": "user", "content": p}
+                            {"role": "user", "content": prompt}
                         ],
                         options={"temperature": 0.5}
                     )
@@ -10,7 +10,10 @@ from models.meeting import Meeting
 from models.reminder import Reminder
 from models.relationship import Relationship
 from beanie import PydanticObjectId
+from pymongo import UpdateOne
 from typing import List
+from datetime import datetime, timezone
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -30,6 +33,7 @@ class DataLinkingService:
             
             # Update note with extracted entities
             note.entities = entities
+            update = {"entities": entities}
             
             # Link to people mentioned
             if entities.get("people"):
@@ -39,20 +43,16 @@ class DataLinkingService:
                 ).to_list()
                 
                 note.linked_people = [person.id for person in people_mentioned]
+                update["linked_people"] = note.linked_people
                 
                 # Create relationships
-                for person in people_mentioned:
-                    await DataLinkingService._create_relationship(
-                        user_id=note.user_id,
-                        source_type="note",
-                        source_id=note.id,
-                        target_type="person",
-                        target_id=person.id,
-                        relationship_type="mentions",
-                        strength=0.8
-                    )
+                await DataLinkingService._create_relationships(
+                    note.user_id,
+                    [("note", note.id, "person", person.id, "mentions", 0.8) for person in people_mentioned]
+                )
             
-            await note.save()
+            # Write only the linking fields - this runs after the response, so a full save could clobber a newer edit
+            await Note.find_one(Note.id == note.id).update({"$set": update})
             logger.info(f"Linked note {note.id} to entities")
             
         except Exception as e:
@@ -66,25 +66,24 @@ class DataLinkingService:
             # This could be enhanced with semantic search
             meeting_content = f"{meeting.title} {meeting.description or ''} {meeting.agenda or ''}"
             
-            # Find similar notes
-            notes = await Note.find(
-                Note.user_id == meeting.user_id
-            ).to_list()
+            # Load the user's notes while the meeting embedding is generated
+            notes, meeting_embedding = await asyncio.gather(
+                Note.find(Note.user_id == meeting.user_id).to_list(),
+                ai_service.generate_embeddings(meeting_content)
+            )
             
             if not notes:
                 return
             
-            # Generate embedding for meeting
-            meeting_embedding = await ai_service.generate_embeddings(meeting_content)
-            
             if meeting_embedding:
-                # Get note embeddings
-                note_embeddings = [(note.id, note.embeddings) for note in notes if note.embeddings]
+                # Get note embeddings - notes embedded before normalization aren't unit-length yet
+                note_embeddings = [(note.id, note.get_unit_embedding()) for note in notes if note.embeddings]
                 
                 # Find similar notes
                 similar_notes = await ai_service.find_similar_content(
                     meeting_embedding,
-                    note_embeddings
+                    note_embeddings,
+                    k=5
                 )
                 
                 # Link top 5 most similar notes (with similarity > 0.7)
@@ -94,19 +93,13 @@ class DataLinkingService:
                 ]
                 
                 meeting.linked_notes = linked_notes
-                await meeting.save()
+                await Meeting.find_one(Meeting.id == meeting.id).update({"$set": {"linked_notes": linked_notes}})
                 
                 # Create relationships
-                for note_id in linked_notes:
-                    await DataLinkingService._create_relationship(
-                        user_id=meeting.user_id,
-                        source_type="meeting",
-                        source_id=meeting.id,
-                        target_type="note",
-                        target_id=note_id,
-                        relationship_type="discusses",
-                        strength=0.7
-                    )
+                await DataLinkingService._create_relationships(
+                    meeting.user_id,
+                    [("meeting", meeting.id, "note", note_id, "discusses", 0.7) for note_id in linked_notes]
+                )
             
             logger.info(f"Linked meeting {meeting.id} to notes")
             
@@ -131,17 +124,12 @@ class DataLinkingService:
                 
                 await reminder.save()
                 reminders.append(reminder)
-                
-                # Create relationship
-                await DataLinkingService._create_relationship(
-                    user_id=meeting.user_id,
-                    source_type="reminder",
-                    source_id=reminder.id,
-                    target_type="meeting",
-                    target_id=meeting.id,
-                    relationship_type="derived_from",
-                    strength=1.0
-                )
+            
+            # Create relationships
+            await DataLinkingService._create_relationships(
+                meeting.user_id,
+                [("reminder", reminder.id, "meeting", meeting.id, "derived_from", 1.0) for reminder in reminders]
+            )
             
             logger.info(f"Created {len(reminders)} reminders from meeting {meeting.id}")
             
@@ -151,38 +139,40 @@ class DataLinkingService:
         return reminders
     
     @staticmethod
-    async def _create_relationship(user_id: PydanticObjectId, source_type: str, source_id: PydanticObjectId,
-                                   target_type: str, target_id: PydanticObjectId,
-                                   relationship_type: str, strength: float) -> None:
-        """Create or update a relationship"""
+    async def _create_relationships(user_id: PydanticObjectId, edges: List[tuple]) -> None:
+        """
+        Create or update many relationships in one bulk write
+        Each edge is (source_type, source_id, target_type, target_id, relationship_type, strength)
+        """
+        if not edges:
+            return
+        
         try:
-            # Check if relationship already exists
-            existing = await Relationship.find_one(
-                Relationship.user_id == user_id,
-                Relationship.source_id == source_id,
-                Relationship.target_id == target_id
+            # Upserts against the unique (user, source, target) index - one round trip for all edges
+            now = datetime.now(timezone.utc)
+            await Relationship.get_pymongo_collection().bulk_write(
+                [
+                    UpdateOne(
+                        {"user_id": user_id, "source_id": source_id, "target_id": target_id},
+                        {
+                            "$set": {"relationship_type": relationship_type, "updated_at": now},
+                            "$max": {"strength": strength},
+                            "$setOnInsert": {
+                                "source_type": source_type,
+                                "target_type": target_type,
+                                "metadata": {},
+                                "created_at": now
+                            }
+                        },
+                        upsert=True
+                    )
+                    for source_type, source_id, target_type, target_id, relationship_type, strength in edges
+                ],
+                ordered=False
             )
-            
-            if existing:
-                # Update existing relationship
-                existing.relationship_type = relationship_type
-                existing.strength = max(existing.strength, strength)
-                await existing.save()
-            else:
-                # Create new relationship
-                relationship = Relationship(
-                    user_id=user_id,
-                    source_type=source_type,
-                    source_id=source_id,
-                    target_type=target_type,
-                    target_id=target_id,
-                    relationship_type=relationship_type,
-                    strength=strength
-                )
-                await relationship.save()
                 
         except Exception as e:
-            logger.error(f"Error creating relationship: {e}")
+            logger.error(f"Error creating relationships: {e}")
 
 
 data_linking_service = DataLinkingService()
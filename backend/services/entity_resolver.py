@@ -0,0 +1,139 @@
+"""
+Entity Resolver
+Maps surface forms of people and topics ("Dr. Smith", "John Smith") to one canonical name
+"""
+
+import re
+import logging
+from collections import defaultdict
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Honorifics that never distinguish two people
+_TITLE_RE = re.compile(r"^(?:dr|mr|mrs|ms|miss|prof|sir)\.?\s+")
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_SPACE_RE = re.compile(r"\s+")
+
+# Stricter than the usual 0.85 - short names like "John"/"Joan" already score ~0.87
+SIMILARITY_THRESHOLD = 0.9
+
+
+def _normalize(name: str, kind: str) -> str:
+    """Lowercase, strip punctuation and (for people) leading titles"""
+    text = _SPACE_RE.sub(" ", name.strip().lower())
+    if kind == "person":
+        text = _TITLE_RE.sub("", text)
+    return _SPACE_RE.sub(" ", _PUNCT_RE.sub("", text)).strip()
+
+
+def jaro_winkler(a: str, b: str, prefix_scale: float = 0.1) -> float:
+    """Jaro-Winkler similarity in [0, 1]"""
+    if a == b:
+        return 1.0
+    len_a, len_b = len(a), len(b)
+    if not len_a or not len_b:
+        return 0.0
+    
+    window = max(max(len_a, len_b) // 2 - 1, 0)
+    matched_b = [False] * len_b
+    matches_a = []
+    for i, char in enumerate(a):
+        for j in range(max(0, i - window), min(len_b, i + window + 1)):
+            if not matched_b[j] and b[j] == char:
+                matched_b[j] = True
+                matches_a.append(char)
+                break
+    if not matches_a:
+        return 0.0
+    
+    matches_b = [b[j] for j in range(len_b) if matched_b[j]]
+    transpositions = sum(x != y for x, y in zip(matches_a, matches_b)) / 2
+    m = len(matches_a)
+    jaro = (m / len_a + m / len_b + (m - transpositions) / m) / 3
+    
+    prefix = 0
+    for x, y in zip(a[:4], b[:4]):
+        if x != y:
+            break
+        prefix += 1
+    return jaro + prefix * prefix_scale * (1 - jaro)
+
+
+class EntityResolver:
+    """Union-find over surface forms - each cluster is represented by its first-seen name"""
+    
+    def __init__(self):
+        # (kind, normalized form) -> parent normalized form
+        self._parent: Dict[tuple, str] = {}
+        # (kind, normalized root) -> display name returned to callers
+        self._display: Dict[tuple, str] = {}
+        # Surname index so a new name is only compared with plausible candidates
+        self._by_last_token: Dict[str, List[str]] = defaultdict(list)
+        # Memo of raw surface form -> canonical name
+        self._resolved: Dict[tuple, str] = {}
+    
+    def _find(self, kind: str, form: str) -> str:
+        """Root of a normalized form, compressing the path on the way"""
+        root = form
+        while self._parent[(kind, root)] != root:
+            root = self._parent[(kind, root)]
+        while form != root:
+            self._parent[(kind, form)], form = root, self._parent[(kind, form)]
+        return root
+    
+    def _match(self, kind: str, form: str):
+        """Existing root this form should join, if any"""
+        # Topics only merge on identical normalized forms - "Q3 planning"/"Q4 planning" are different topics
+        if kind != "person":
+            return None
+        
+        tokens = form.split()
+        # "smith" joins "john smith" when exactly one known person has that surname
+        if len(tokens) == 1:
+            roots = {self._find(kind, other) for other in self._by_last_token[form]}
+            return roots.pop() if len(roots) == 1 else None
+        
+        # Full names must share the surname exactly; only the given name may be a near miss ("Jon"/"John")
+        # Compared with cluster roots only, so "Joan" cannot chain into "John" through "Jon"
+        given = " ".join(tokens[:-1])
+        for root in dict.fromkeys(self._find(kind, other) for other in self._by_last_token[tokens[-1]]):
+            if jaro_winkler(given, root.rsplit(" ", 1)[0]) >= SIMILARITY_THRESHOLD:
+                return root
+        return None
+    
+    def canonicalize(self, name: str, kind: str = "person") -> str:
+        """Canonical display name for a person or topic surface form"""
+        resolved = self._resolved.get((kind, name))
+        if resolved is not None:
+            return resolved
+        
+        form = _normalize(name, kind)
+        if not form:
+            return name
+        
+        if (kind, form) not in self._parent:
+            root = self._match(kind, form)
+            self._parent[(kind, form)] = root or form
+            if root is None:
+                self._display[(kind, form)] = name.strip()
+            if kind == "person" and " " in form:
+                self._by_last_token[form.rsplit(" ", 1)[1]].append(form)
+        
+        canonical = self._display[(kind, self._find(kind, form))]
+        self._resolved[(kind, name)] = canonical
+        return canonical
+    
+    def canonicalize_entities(self, entities: Dict) -> Dict:
+        """Copy of an ai_entities dict with people and topics canonicalized and deduplicated"""
+        resolved = dict(entities)
+        for key, kind in (("people", "person"), ("topics", "topic")):
+            values = entities.get(key)
+            if isinstance(values, list):
+                resolved[key] = list(dict.fromkeys(
+                    self.canonicalize(value, kind) for value in values if isinstance(value, str)
+                ))
+        return resolved
+
+
+entity_resolver = EntityResolver()
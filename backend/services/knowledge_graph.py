@@ -6,7 +6,7 @@ Powers all AI insights, context, and discovery
 
 import logging
 from typing import Dict, List, Any, Optional, Set, Tuple
-from collections import defaultdict
+from collections import defaultdict, Counter
 from datetime import datetime
 import json
 
@@ -64,6 +64,8 @@ class KnowledgeGraph:
         self.edges: Dict[str, List[Edge]] = defaultdict(list)  # source_id -> [Edge]
         self.reverse_edges: Dict[str, List[Edge]] = defaultdict(list)  # target_id -> [Edge]
         self.type_index: Dict[str, Set[str]] = defaultdict(set)  # node_type -> {node_ids}
+        self.degree: Counter = Counter()  # node_id -> in + out degree
+        self.degree_by_type: Dict[str, Counter] = defaultdict(Counter)  # node_type -> {node_id: degree}
         
         logger.info("🕸️ Knowledge Graph initialized")
     
@@ -106,6 +108,11 @@ class KnowledgeGraph:
         self.edges[source_id].append(edge)
         self.reverse_edges[target_id].append(edge)
         
+        # Keep degree centrality current so get_central_nodes never rescans the graph
+        for node_id in (source_id, target_id):
+            self.degree[node_id] += 1
+            self.degree_by_type[self.nodes[node_id].type][node_id] += 1
+        
         logger.debug(f"Added edge: {source_id} --[{edge_type}]--> {target_id}")
         return edge
     
@@ -325,19 +332,8 @@ class KnowledgeGraph:
     
     def get_central_nodes(self, node_type: Optional[str] = None, limit: int = 10) -> List[Tuple[str, int]]:
         """Find most connected nodes (highest degree centrality)"""
-        degree = {}
-        
-        nodes_to_check = self.nodes.keys()
-        if node_type:
-            nodes_to_check = self.type_index.get(node_type, set())
-        
-        for node_id in nodes_to_check:
-            in_degree = len(self.get_edges_to(node_id))
-            out_degree = len(self.get_edges_from(node_id))
-            degree[node_id] = in_degree + out_degree
-        
-        sorted_nodes = sorted(degree.items(), key=lambda x: x[1], reverse=True)
-        return sorted_nodes[:limit]
+        degree = self.degree_by_type.get(node_type, Counter()) if node_type else self.degree
+        return degree.most_common(limit)
     
     def get_clusters(self, node_type: str = 'topic') -> Dict[str, List[str]]:
         """Find clusters of related nodes"""
@@ -0,0 +1,151 @@
+"""
+Knowledge Graph Service
+Builds the user's graph from MongoDB documents and their stored relationships
+"""
+
+from models.note import Note
+from models.person import Person
+from models.meeting import Meeting
+from models.reminder import Reminder
+from models.relationship import Relationship
+from beanie import PydanticObjectId
+from beanie.operators import In, Or
+from pydantic import BaseModel, Field
+from typing import List, Dict, Any, Optional, AsyncIterator
+from datetime import datetime
+import asyncio
+import logging
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class _GraphNodeView(BaseModel):
+    """Projection for graph nodes - never pulls embeddings or full bodies"""
+    id: PydanticObjectId = Field(alias="_id")
+    title: Optional[str] = None
+    name: Optional[str] = None
+    entities: dict = Field(default_factory=dict)
+    created_at: Optional[datetime] = None
+
+
+class KnowledgeGraphService:
+    """Service for building and querying the knowledge graph"""
+    
+    @staticmethod
+    async def stream_knowledge_graph(user_id: PydanticObjectId) -> AsyncIterator[bytes]:
+        """Yield the full graph as JSON chunks, one document at a time"""
+        total_nodes = 0
+        yield b'{"nodes":['
+        for node_type, model in (("note", Note), ("person", Person), ("meeting", Meeting), ("reminder", Reminder)):
+            async for doc in model.find(model.user_id == user_id).project(_GraphNodeView):
+                if total_nodes:
+                    yield b','
+                yield orjson.dumps({
+                    "id": str(doc.id),
+                    "label": doc.title or doc.name or "",
+                    "type": node_type,
+                    "created_at": doc.created_at
+                })
+                total_nodes += 1
+        
+        total_edges = 0
+        yield b'],"edges":['
+        async for rel in Relationship.find(Relationship.user_id == user_id):
+            if total_edges:
+                yield b','
+            yield orjson.dumps({
+                "from": str(rel.source_id),
+                "to": str(rel.target_id),
+                "type": rel.relationship_type,
+                "strength": rel.strength
+            })
+            total_edges += 1
+        
+        yield b'],"clusters":[],"total_nodes":%d,"total_edges":%d}' % (total_nodes, total_edges)
+    
+    @staticmethod
+    async def get_entity_connections(entity_id: PydanticObjectId, user_id: PydanticObjectId,
+                                     depth: int = 2) -> List[Dict[str, Any]]:
+        """Breadth-first walk of relationships around an entity, one query per level"""
+        connections = []
+        visited = {entity_id}
+        frontier = [entity_id]
+        
+        for level in range(1, depth + 1):
+            if not frontier:
+                break
+            
+            relationships = await Relationship.find(
+                Relationship.user_id == user_id,
+                Or(In(Relationship.source_id, frontier), In(Relationship.target_id, frontier))
+            ).to_list()
+            
+            next_frontier = []
+            for rel in relationships:
+                for other_id, other_type in ((rel.target_id, rel.target_type), (rel.source_id, rel.source_type)):
+                    if other_id in visited:
+                        continue
+                    visited.add(other_id)
+                    next_frontier.append(other_id)
+                    connections.append({
+                        "id": str(other_id),
+                        "type": other_type,
+                        "relationship": rel.relationship_type,
+                        "strength": rel.strength,
+                        "depth": level
+                    })
+            frontier = next_frontier
+        
+        return connections
+    
+    @staticmethod
+    async def get_mind_map(user_id: PydanticObjectId, entity_id: PydanticObjectId) -> Dict[str, Any]:
+        """Mind map of an entity's direct and second-degree connections"""
+        connections = await KnowledgeGraphService.get_entity_connections(entity_id, user_id, depth=2)
+        return {
+            "center": str(entity_id),
+            "branches": [c for c in connections if c["depth"] == 1],
+            "leaves": [c for c in connections if c["depth"] == 2]
+        }
+    
+    @staticmethod
+    async def discover_new_relationships(user_id: PydanticObjectId, limit: int = 10) -> List[Dict[str, Any]]:
+        """Suggest note pairs that share people or topics but are not yet linked"""
+        notes, relationships = await asyncio.gather(
+            Note.find(Note.user_id == user_id).project(_GraphNodeView).to_list(),
+            Relationship.find(Relationship.user_id == user_id).to_list()
+        )
+        
+        linked = {(rel.source_id, rel.target_id) for rel in relationships}
+        linked |= {(target, source) for source, target in linked}
+        
+        entity_sets = {
+            note.id: {
+                str(value).lower()
+                for key in ("people", "topics")
+                for value in note.entities.get(key, [])
+            }
+            for note in notes
+        }
+        
+        discovered = []
+        for i, first in enumerate(notes):
+            for second in notes[i + 1:]:
+                if (first.id, second.id) in linked:
+                    continue
+                shared = entity_sets[first.id] & entity_sets[second.id]
+                if shared:
+                    discovered.append({
+                        "source_id": str(first.id),
+                        "target_id": str(second.id),
+                        "relationship_type": "related_to",
+                        "shared_entities": sorted(shared),
+                        "strength": min(len(shared) / 5, 1.0)
+                    })
+        
+        discovered.sort(key=lambda d: d["strength"], reverse=True)
+        return discovered[:limit]
+
+
+knowledge_graph_service = KnowledgeGraphService()
@@ -0,0 +1,159 @@
+"""
+Note Index
+Incrementally maintained views over the notes store, updated on write instead of rescanned per agent tick
+"""
+
+from services.entity_resolver import entity_resolver
+from typing import Dict, Any, List, Tuple
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+import bisect
+import calendar
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _created_at(note: Dict[str, Any]) -> str:
+    """Sort key for a note - ISO strings order chronologically"""
+    return note.get('created_at') or ''
+
+
+# record id -> (created_at string, parsed epoch) - kept off the records, which are served and persisted as-is
+_created_epochs: Dict[str, Tuple[str, Optional[int]]] = {}
+
+
+def created_ts(record: Dict[str, Any]) -> Optional[int]:
+    """
+    created_at as wall-clock epoch seconds, parsed once per record and remembered by id
+    Wall-clock (offset dropped, read as UTC) so hours and days match the stored string
+    """
+    created_at = _created_at(record)
+    cached = _created_epochs.get(record.get('id'))
+    if cached is not None and cached[0] == created_at:
+        return cached[1]
+    try:
+        parsed = datetime.fromisoformat(created_at)
+    except (TypeError, ValueError):
+        ts = None
+    else:
+        ts = calendar.timegm(parsed.timetuple())
+    if record.get('id') is not None:
+        _created_epochs[record['id']] = (created_at, ts)
+    return ts
+
+
+def now_ts() -> int:
+    """Current local wall-clock time on the same scale as created_ts"""
+    return calendar.timegm(datetime.now().timetuple())
+
+
+def _decrement(counter: Counter, keys) -> None:
+    """Take one off each key, dropping keys that reach zero"""
+    for key in keys:
+        counter[key] -= 1
+        if counter[key] <= 0:
+            del counter[key]
+
+
+class NoteIndex:
+    """Recency order, mention counts and last-mention times for the notes store"""
+    
+    def __init__(self):
+        self._notes: Dict[str, Dict[str, Any]] = {}
+        # (created_at string, note id), ascending - ISO strings sort chronologically
+        self._by_created: List[Tuple[str, str]] = []
+        # note id -> (people, topics) it contributed, so an update can subtract them again
+        self._contributions: Dict[str, Tuple[tuple, tuple]] = {}
+        self.person_mentions: Counter = Counter()
+        self.topic_mentions: Counter = Counter()
+        # person -> (created_ts of their latest note, note id)
+        self.person_last_seen: Dict[str, Tuple[int, str]] = {}
+    
+    def load(self, notes_db: Dict[str, Dict[str, Any]]) -> None:
+        """Rebuild from an existing store"""
+        self.__init__()
+        for note in notes_db.values():
+            self.add(note)
+        logger.info(f"Indexed {len(self._notes)} notes")
+    
+    def add(self, note: Dict[str, Any]) -> None:
+        """Index a new note (re-indexes if the id is already known)"""
+        if note['id'] in self._notes:
+            self.remove(note['id'])
+        self._notes[note['id']] = note
+        bisect.insort(self._by_created, (_created_at(note), note['id']))
+        self._add_entities(note)
+    
+    def update(self, note: Dict[str, Any]) -> None:
+        """Refresh a note's entity contributions after it was processed or edited"""
+        if note['id'] not in self._notes:
+            self.add(note)
+            return
+        self._remove_entities(note['id'])
+        self._notes[note['id']] = note
+        self._add_entities(note)
+    
+    def remove(self, note_id: str) -> None:
+        """Drop a note from every view"""
+        note = self._notes.pop(note_id, None)
+        if note is None:
+            return
+        _created_epochs.pop(note_id, None)
+        key = (_created_at(note), note_id)
+        position = bisect.bisect_left(self._by_created, key)
+        if position < len(self._by_created) and self._by_created[position] == key:
+            del self._by_created[position]
+        self._remove_entities(note_id)
+    
+    def recent(self, k: int) -> List[Dict[str, Any]]:
+        """The k newest notes, newest first"""
+        return [self._notes[note_id] for _, note_id in reversed(self._by_created[-k:])] if k > 0 else []
+    
+    def _add_entities(self, note: Dict[str, Any]) -> None:
+        """Count a note's canonical people and topics"""
+        entities = note.get('ai_entities') or {}
+        people = tuple(dict.fromkeys(map(entity_resolver.canonicalize, entities.get('people', []))))
+        topics = tuple(entities.get('topics', []))
+        self._contributions[note['id']] = (people, topics)
+        self.person_mentions.update(people)
+        self.topic_mentions.update(topics)
+        
+        created = created_ts(note)
+        if created is None:
+            return
+        for person in people:
+            seen = self.person_last_seen.get(person)
+            if seen is None or created > seen[0]:
+                self.person_last_seen[person] = (created, note['id'])
+    
+    def _remove_entities(self, note_id: str) -> None:
+        """Undo a note's contribution to the counters"""
+        people, topics = self._contributions.pop(note_id, ((), ()))
+        _decrement(self.person_mentions, people)
+        _decrement(self.topic_mentions, topics)
+        
+        for person in people:
+            seen = self.person_last_seen.get(person)
+            if seen is not None and seen[1] == note_id:
+                self._recompute_last_seen(person)
+    
+    def _recompute_last_seen(self, person: str) -> None:
+        """Latest mention of one person - only needed when their latest note changes"""
+        latest = None
+        for note_id, (people, _) in self._contributions.items():
+            if person not in people:
+                continue
+            created = created_ts(self._notes[note_id])
+            if created is None:
+                continue
+            if latest is None or created > latest[0]:
+                latest = (created, note_id)
+        if latest is None:
+            self.person_last_seen.pop(person, None)
+        else:
+            self.person_last_seen[person] = latest
+
+
+note_index = NoteIndex()
@@ -0,0 +1,28 @@
+"""
+Shared Ollama client
+One keep-alive connection pool per process instead of a client per call site
+"""
+
+import ollama
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from config.settings import settings
+
+ollama_client = ollama.Client(
+    host=settings.OLLAMA_HOST,
+    timeout=settings.OLLAMA_TIMEOUT,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40)
+)
+
+# Installed as the event loop's default executor at startup, so run_in_executor(None, ...) calls to the sync client get enough threads
+ai_executor = ThreadPoolExecutor(
+    max_workers=settings.AI_THREAD_POOL_SIZE,
+    thread_name_prefix="ai-svc"
+)
+
+# Native asyncio client for callers that fan requests out with asyncio.gather
+async_ollama_client = ollama.AsyncClient(
+    host=settings.OLLAMA_HOST,
+    timeout=settings.OLLAMA_TIMEOUT,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40)
+)
@@ -2,13 +2,15 @@
 Simple test server - works with local Ollama for AI features
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, EmailStr
 from typing import List, Dict, Optional, Any
 import uvicorn
 from datetime import datetime
 import asyncio
+import hashlib
+import heapq
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,8 +18,10 @@ logger = logging.getLogger(__name__)
 # Import background processor and AI agents
 from services.background_processor import processor
 from services.neo4j_service import init_neo4j
+from services.ollama_client import ollama_client, ai_executor
 from services.agent_orchestrator import orchestrator
 from services.knowledge_graph import knowledge_graph
+from services.note_index import note_index
 from persistence import persistence
 
 # Load persistent storage from files
@@ -34,12 +38,14 @@ bp_module.notes_db = notes_db
 bp_module.people_db = people_db
 bp_module.reminders_db = reminders_db
 bp_module.meetings_db = meetings_db
-bp_module.save_callback = lambda: persistence.save_all({
-    'notes': notes_db,
-    'people': people_db,
-    'reminders': reminders_db,
-    'meetings': meetings_db
-})
+def _mark_processed_stores_dirty():
+    """Queue the stores the background processor mutates for the next flush"""
+    persistence.mark_dirty('notes', notes_db)
+    persistence.mark_dirty('people', people_db)
+    persistence.mark_dirty('reminders', reminders_db)
+    persistence.mark_dirty('meetings', meetings_db)
+
+bp_module.save_callback = _mark_processed_stores_dirty
 
 # Helper function to save data
 def save_data():
@@ -82,6 +88,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Graph payloads can be large - let clients revalidate them with If-None-Match
+ETAG_PATH_PREFIXES = ("/api/graph/", "/api/knowledge-graph/")
+
+@app.middleware("http")
+async def graph_etag(request: Request, call_next):
+    """Attach ETags to graph GETs and answer 304 when the client copy is current"""
+    response = await call_next(request)
+    if (request.method != "GET" or response.status_code != 200
+            or not request.url.path.startswith(ETAG_PATH_PREFIXES)):
+        return response
+    
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    headers = dict(response.headers)
+    headers["ETag"] = etag
+    return Response(content=body, status_code=200, headers=headers, media_type=response.media_type)
+
 # Models
 class RegisterRequest(BaseModel):
     email: EmailStr
@@ -100,10 +126,17 @@ class NoteCreate(BaseModel):
 class MessageInfer(BaseModel):
     message: str
 
+class ConnectionsBatchRequest(BaseModel):
+    note_ids: List[str]
+
 # Startup event
 @app.on_event("startup")
 async def startup_event():
     """Start background processor and AI agents on startup"""
+    # Blocking Ollama calls run on a pool sized by AI_THREAD_POOL_SIZE rather than asyncio's small default
+    asyncio.get_running_loop().set_default_executor(ai_executor)
+    # Write-behind flushing of the JSON stores
+    persistence.start()
     await processor.start()
     # Start the processing loop
     asyncio.create_task(processor._process_loop())
@@ -150,6 +183,7 @@ async def shutdown_event():
     await orchestrator.stop()
     # Save all data before shutdown
     print("💾 Saving all data before shutdown...")
+    await persistence.stop()
     save_data()
     print("✅ Data saved successfully")
 
@@ -178,7 +212,8 @@ def register(data: RegisterRequest):
     token_store[token] = user_id
     
     # Save to disk
-    save_data()
+    persistence.mark_dirty('users', users_db)
+    persistence.mark_dirty('tokens', token_store)
     
     return {
         "access_token": token,
@@ -196,7 +231,7 @@ def login(data: LoginRequest):
     token_store[token] = user['id']
     
     # Save tokens
-    persistence.save('tokens', token_store)
+    persistence.mark_dirty('tokens', token_store)
     
     return {
         "access_token": token,
@@ -217,6 +252,7 @@ async def create_note(note: NoteCreate, background_tasks: BackgroundTasks):
         "ai_processed": False
     }
     notes_db[note_id] = note_data
+    note_index.add(note_data)
     
     # Process in background with AI
     await processor.add_to_queue("note", note_data, "current_user")
@@ -225,13 +261,23 @@ async def create_note(note: NoteCreate, background_tasks: BackgroundTasks):
     knowledge_graph.ingest_note(note_data)
     
     # Save to disk
-    persistence.save('notes', notes_db)
+    persistence.mark_dirty('notes', notes_db)
     
     return note_data
 
+# Fields kept server-side only - embeddings alone are hundreds of floats per note
+NOTE_PRIVATE_FIELDS = frozenset({'embeddings'})
+
 @app.get("/api/notes")
-def get_notes():
-    return list(notes_db.values())
+def get_notes(limit: Optional[int] = None):
+    notes = notes_db.values()
+    if limit:
+        # Most recent first, without sorting the whole store
+        notes = heapq.nlargest(limit, notes, key=lambda n: n.get('created_at', ''))
+    return [
+        {k: v for k, v in note.items() if k not in NOTE_PRIVATE_FIELDS}
+        for note in notes
+    ]
 
 @app.get("/api/people")
 def get_people():
@@ -270,7 +316,6 @@ async def get_legacy_knowledge_graph():
             logger.error(f"Neo4j error: {e}, falling back to in-memory")
     
     # Fallback to in-memory graph generation
-    import ollama
     from collections import defaultdict
     
     # Build nodes from notes
@@ -292,7 +337,7 @@ async def get_legacy_knowledge_graph():
         # Extract entities from note using AI if not already processed
         if not note.get("ai_processed") and note.get("content"):
             try:
-                response = ollama.chat(
+                response = ollama_client.chat(
                     model='llama3.2:latest',
                     messages=[{
                         'role': 'system',
@@ -404,8 +449,6 @@ async def infer_message(data: MessageInfer):
 async def query_insights(data: MessageInfer):
     """Query your data and get insights"""
     try:
-        import ollama
-        
         # Gather context from all notes
         context_parts = []
         for note in notes_db.values():
@@ -419,7 +462,7 @@ async def query_insights(data: MessageInfer):
         context = "\n".join(context_parts[:10])  # Limit context
         
         # Query with context
-        response = ollama.chat(
+        response = ollama_client.chat(
             model='llama3.2:latest',
             messages=[{
                 'role': 'system',
@@ -456,7 +499,7 @@ async def get_ai_insights():
     insights = orchestrator.shared_memory.get('insights_queue', [])
     # Return most recent 10 insights, sorted by priority
     sorted_insights = sorted(
-        insights[-20:], 
+        insights, 
         key=lambda x: {'high': 3, 'medium': 2, 'low': 1}.get(x.get('priority', 'low'), 0),
         reverse=True
     )[:10]
@@ -468,12 +511,10 @@ async def get_current_context():
     context = orchestrator.shared_memory.get('user_context', {})
     return {"context": context, "status": "success"}
 
-@app.get("/api/ai/connections/{note_id}")
-async def get_note_connections(note_id: str):
-    """Get AI-discovered connections for a specific note"""
+def _enrich_connections(note_id: str) -> List[Dict[str, Any]]:
+    """Resolve a note's AI-discovered connections against the notes store"""
     connections = orchestrator.shared_memory.get('cross_references', {}).get(note_id, [])
     
-    # Enrich with note details
     enriched = []
     for conn in connections:
         target_note = notes_db.get(conn['target_id'])
@@ -487,6 +528,20 @@ async def get_note_connections(note_id: str):
                 'target_preview': target_note.get('content', '')[:200],
                 'target_created': target_note.get('created_at')
             })
+    return enriched
+
+@app.post("/api/ai/connections/batch")
+async def get_notes_connections(request: ConnectionsBatchRequest):
+    """Get AI-discovered connections for several notes in one request"""
+    return {
+        "connections": {note_id: _enrich_connections(note_id) for note_id in request.note_ids},
+        "status": "success"
+    }
+
+@app.get("/api/ai/connections/{note_id}")
+async def get_note_connections(note_id: str):
+    """Get AI-discovered connections for a specific note"""
+    enriched = _enrich_connections(note_id)
     
     return {
         "note_id": note_id,